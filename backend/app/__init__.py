@@ -0,0 +1,4 @@
+import time
+
+# Reference point for measuring how long the app takes to import (see main.py).
+IMPORT_STARTED = time.perf_counter()
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+from typing import Any
+
+from fastapi import APIRouter, Depends, Header, HTTPException
+from fastapi.responses import PlainTextResponse
+
+from backend.app.services.profiling import get_profile_store, is_admin_token
+
+
+def require_admin(x_admin_token: str | None = Header(default=None)) -> None:
+    # Without COPILOT_ADMIN_TOKEN the admin endpoints are closed to everyone.
+    if not is_admin_token(x_admin_token):
+        raise HTTPException(status_code=403, detail="Invalid or missing admin token")
+
+
+router = APIRouter(
+    prefix="/admin/profiles", tags=["admin"], dependencies=[Depends(require_admin)]
+)
+
+
+@router.get("")
+def list_profiles() -> dict[str, Any]:
+    return {"profiles": [p.metadata() for p in get_profile_store().list()]}
+
+
+@router.get("/{profile_id}")
+def get_profile(profile_id: str) -> dict[str, Any]:
+    profile = get_profile_store().get(profile_id)
+    if profile is None:
+        raise HTTPException(status_code=404, detail=f"Unknown profile: {profile_id}")
+    return profile.metadata()
+
+
+@router.get("/{profile_id}/folded", response_class=PlainTextResponse)
+def get_profile_folded(profile_id: str) -> PlainTextResponse:
+    profile = get_profile_store().get(profile_id)
+    if profile is None:
+        raise HTTPException(status_code=404, detail=f"Unknown profile: {profile_id}")
+    return PlainTextResponse(
+        profile.folded(),
+        headers={"Content-Disposition": f'attachment; filename="{profile_id}.folded"'},
+    )
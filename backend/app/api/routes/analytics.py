@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from datetime import date
+from typing import Literal
+
+from fastapi import APIRouter, Query
+
+from backend.app.db.session import get_engine
+from backend.app.schemas import OutcomeAnalyticsResponse, OutcomeRateRow
+from backend.app.services.analytics import outcome_rates
+
+router = APIRouter(prefix="/analytics", tags=["analytics"])
+
+Dimension = Literal["sector", "position", "market", "channel"]
+
+
+@router.get("/outcomes", response_model=OutcomeAnalyticsResponse)
+def outcomes(
+    group_by: list[Dimension] = Query(default=["sector"]),
+    bucket: Literal["day", "week", "month"] = "week",
+    since: date | None = None,
+    until: date | None = None,
+    sector: str | None = None,
+    position: str | None = None,
+    market: str | None = None,
+    channel: str | None = None,
+) -> OutcomeAnalyticsResponse:
+    rows = outcome_rates(
+        engine=get_engine(),
+        group_by=list(group_by),
+        bucket=bucket,
+        since=since,
+        until=until,
+        filters={
+            "sector": sector,
+            "position": position,
+            "market": market,
+            "channel": channel,
+        },
+    )
+    return OutcomeAnalyticsResponse(
+        bucket=bucket,
+        group_by=list(group_by),
+        rows=[OutcomeRateRow(**row) for row in rows],
+    )
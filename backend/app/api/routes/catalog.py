@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from fastapi import APIRouter, Query
+
+from backend.app.db.session import get_engine
+from backend.app.schemas import (
+    AthleteItem,
+    AthletePage,
+    DocumentItem,
+    DocumentPage,
+    SponsorItem,
+    SponsorPage,
+)
+from backend.app.services.listing import list_page
+
+router = APIRouter(tags=["catalog"])
+
+# `after` is the `next_cursor` of the previous page (omit it for the first page).
+
+
+@router.get("/athletes", response_model=AthletePage)
+def list_athletes(
+    position: str | None = None,
+    after: str | None = None,
+    limit: int = Query(default=50, ge=1, le=500),
+) -> AthletePage:
+    rows, next_cursor = list_page(
+        get_engine(),
+        table="athletes",
+        filters={"position": position},
+        after=after,
+        limit=limit,
+    )
+    return AthletePage(items=[AthleteItem(**r) for r in rows], next_cursor=next_cursor)
+
+
+@router.get("/sponsors", response_model=SponsorPage)
+def list_sponsors(
+    market: str | None = None,
+    sector: str | None = None,
+    after: str | None = None,
+    limit: int = Query(default=50, ge=1, le=500),
+) -> SponsorPage:
+    rows, next_cursor = list_page(
+        get_engine(),
+        table="sponsors",
+        filters={"market": market, "sector": sector},
+        after=after,
+        limit=limit,
+    )
+    return SponsorPage(items=[SponsorItem(**r) for r in rows], next_cursor=next_cursor)
+
+
+@router.get("/documents", response_model=DocumentPage)
+def list_documents(
+    locale: str | None = None,
+    owner_type: str | None = None,
+    owner_id: str | None = None,
+    after: str | None = None,
+    limit: int = Query(default=50, ge=1, le=500),
+) -> DocumentPage:
+    rows, next_cursor = list_page(
+        get_engine(),
+        table="documents",
+        filters={"locale": locale, "owner_type": owner_type, "owner_id": owner_id},
+        after=after,
+        limit=limit,
+    )
+    return DocumentPage(items=[DocumentItem(**r) for r in rows], next_cursor=next_cursor)
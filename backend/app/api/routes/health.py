@@ -1,4 +1,11 @@
-from fastapi import APIRouter
+from typing import Any
+
+from fastapi import APIRouter, Request, Response
+
+from backend.app.services.circuit_breaker import get_llm_breaker
+from backend.app.services.llm_client import hedge_delay_seconds
+from backend.app.services.llm_pool import get_llm_pool
+from backend.app.services.warmup import refresh_db_check
 
 router = APIRouter(tags=["health"])
 
@@ -6,3 +13,29 @@ router = APIRouter(tags=["health"])
 @router.get("/health")
 def health() -> dict[str, str]:
     return {"status": "ok"}
+
+
+@router.get("/ready")
+def ready(request: Request, response: Response) -> dict[str, Any]:
+    state = getattr(request.app.state, "startup", None)
+    if state is not None and state.startup_seconds is not None:
+        refresh_db_check(state)
+    is_ready = state is not None and state.ready
+    if not is_ready:
+        response.status_code = 503
+
+    return {
+        "status": "ready" if is_ready else "not_ready",
+        "import_seconds": state.import_seconds if state else None,
+        "startup_seconds": state.startup_seconds if state else None,
+        "checks": state.checks if state else {},
+    }
+
+
+@router.get("/health/llm")
+def llm_backends() -> dict[str, Any]:
+    return {
+        "circuit": get_llm_breaker().snapshot(),
+        "hedge_delay_seconds": hedge_delay_seconds(),
+        "backends": get_llm_pool().snapshot(),
+    }
@@ -1,51 +1,50 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
+from itertools import chain
+from typing import Any
+
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 
-from backend.app.db.session import engine
+from backend.app.db.session import get_engine
 from backend.app.schemas import (
     MeasurementPlan,
     Offer,
     OfferPackage,
+    OutreachExportRequest,
     OutreachPackRequest,
     OutreachPackResponse,
+    OutreachVariant,
+    OutreachVariantsRequest,
+    OutreachVariantsResponse,
     RecommendedAsset,
 )
-from backend.app.services.outreach_pack import build_outreach_pack
+from backend.app.services.outreach_pack import (
+    build_outreach_pack,
+    build_outreach_variants,
+)
+from backend.app.services.pack_export import (
+    csv_stream,
+    iter_sponsors,
+    ndjson_stream,
+    zip_stream,
+)
+from backend.app.services.profiling import profiled
 
 router = APIRouter(prefix="/outreach-pack", tags=["outreach"])
 
 
-@router.post("", response_model=OutreachPackResponse)
-def outreach_pack(payload: OutreachPackRequest) -> OutreachPackResponse:
-    try:
-        (
-            fit_score,
-            fit_explanations,
-            talking_points,
-            email_outreach,
-            one_pager_markdown,
-            evidence,
-            offer_packages,
-            measurement_plan,
-            recommended_assets,
-        ) = build_outreach_pack(
-            engine=engine,
-            athlete_id=payload.athlete_id,
-            sponsor_id=payload.sponsor_id,
-            locale=payload.locale,
-            market=payload.market,
-            tone=payload.tone,
-            channel=payload.channel,
-        )
-    except ValueError as exc:
-        raise HTTPException(status_code=404, detail=str(exc)) from exc
-
-    # ✅ PUT YOUR BLOCK HERE (right after build_outreach_pack)
+def _sellable_blocks(
+    market: str,
+    offer_packages: list[tuple[str, list[str], str]],
+    measurement_plan: dict[str, Any],
+    recommended_assets: list[dict[str, str]],
+) -> tuple[Offer, MeasurementPlan, list[RecommendedAsset]]:
     currency = (
         "EUR"
-        if payload.market.upper() == "FR"
-        else "GBP" if payload.market.upper() == "UK" else "EUR"
+        if market.upper() == "FR"
+        else "GBP" if market.upper() == "UK" else "EUR"
     )
 
     offer = Offer(
@@ -67,7 +66,28 @@ def outreach_pack(payload: OutreachPackRequest) -> OutreachPackResponse:
         for a in recommended_assets
     ]
 
-    # ✅ then return the full response
+    return offer, measurement, assets
+
+
+def _pack_response(
+    pack: tuple[Any, ...], *, locale: str, market: str
+) -> OutreachPackResponse:
+    (
+        fit_score,
+        fit_explanations,
+        talking_points,
+        email_outreach,
+        one_pager_markdown,
+        evidence,
+        offer_packages,
+        measurement_plan,
+        recommended_assets,
+    ) = pack
+
+    offer, measurement, assets = _sellable_blocks(
+        market, offer_packages, measurement_plan, recommended_assets
+    )
+
     return OutreachPackResponse(
         fit_score=fit_score,
         fit_explanations=fit_explanations,
@@ -78,6 +98,157 @@ def outreach_pack(payload: OutreachPackRequest) -> OutreachPackResponse:
         offer=offer,
         measurement_plan=measurement,
         recommended_assets=assets,
+        locale=locale,
+        market=market,
+    )
+
+
+@router.post("", response_model=OutreachPackResponse)
+@profiled
+def outreach_pack(payload: OutreachPackRequest) -> OutreachPackResponse:
+    try:
+        pack = build_outreach_pack(
+            engine=get_engine(),
+            athlete_id=payload.athlete_id,
+            sponsor_id=payload.sponsor_id,
+            locale=payload.locale,
+            market=payload.market,
+            tone=payload.tone,
+            channel=payload.channel,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=404, detail=str(exc)) from exc
+
+    return _pack_response(pack, locale=payload.locale, market=payload.market)
+
+
+@router.post("/variants", response_model=OutreachVariantsResponse)
+@profiled
+def outreach_pack_variants(payload: OutreachVariantsRequest) -> OutreachVariantsResponse:
+    try:
+        base, variants = build_outreach_variants(
+            engine=get_engine(),
+            athlete_id=payload.athlete_id,
+            sponsor_id=payload.sponsor_id,
+            locale=payload.locale,
+            market=payload.market,
+            tones=payload.tones,
+            channels=payload.channels,
+            max_variants=payload.max_variants,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=404, detail=str(exc)) from exc
+
+    offer, measurement, assets = _sellable_blocks(
+        payload.market, base.offer_packages, base.measurement_plan, base.recommended_assets
+    )
+
+    return OutreachVariantsResponse(
+        fit_score=base.fit_score,
+        fit_explanations=base.fit_explanations,
+        talking_points=base.talking_points,
+        variants=[
+            OutreachVariant(
+                tone=tone,
+                channel=channel,
+                email_outreach=email,
+                one_pager_markdown=one_pager,
+                source=source,
+            )
+            for tone, channel, email, one_pager, source in variants
+        ],
+        evidence=base.evidence,
+        offer=offer,
+        measurement_plan=measurement,
+        recommended_assets=assets,
         locale=payload.locale,
         market=payload.market,
     )
+
+
+_CSV_FIELDS = [
+    "athlete_id",
+    "sponsor_id",
+    "market",
+    "fit_score",
+    "email_subject",
+    "email_body",
+    "one_pager_markdown",
+    "currency",
+    "evidence_ids",
+]
+
+_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+    "zip": "application/zip",
+}
+
+
+def _iter_export_packs(
+    payload: OutreachExportRequest,
+) -> Iterator[tuple[str, OutreachPackResponse]]:
+    engine = get_engine()
+    for sponsor in iter_sponsors(engine, market=payload.market, sector=payload.sector):
+        pack = build_outreach_pack(
+            engine=engine,
+            athlete_id=payload.athlete_id,
+            sponsor_id=sponsor["id"],
+            locale=payload.locale,
+            market=sponsor["market"],
+            tone=payload.tone,
+            channel=payload.channel,
+        )
+        yield sponsor["id"], _pack_response(
+            pack, locale=payload.locale, market=sponsor["market"]
+        )
+
+
+# Not @profiled: the body is generated after the handler returns, so stack samples
+# would only cover the first pack. A profiled export still records DB/LLM timings.
+@router.post("/export")
+def outreach_pack_export(payload: OutreachExportRequest) -> StreamingResponse:
+    packs = _iter_export_packs(payload)
+    try:
+        # Build the first pack eagerly: an unknown athlete becomes a 404, not a broken stream.
+        first = next(packs, None)
+    except ValueError as exc:
+        raise HTTPException(status_code=404, detail=str(exc)) from exc
+    if first is not None:
+        packs = chain([first], packs)
+
+    if payload.format == "zip":
+        body = zip_stream(
+            (f"{payload.athlete_id}_{sponsor_id}.md", pack.one_pager_markdown)
+            for sponsor_id, pack in packs
+        )
+    elif payload.format == "csv":
+        body = csv_stream(
+            (
+                {
+                    "athlete_id": payload.athlete_id,
+                    "sponsor_id": sponsor_id,
+                    "market": pack.market,
+                    "fit_score": pack.fit_score,
+                    "email_subject": pack.email_outreach.subject,
+                    "email_body": pack.email_outreach.body,
+                    "one_pager_markdown": pack.one_pager_markdown,
+                    "currency": pack.offer.currency,
+                    "evidence_ids": " ".join(e.id for e in pack.evidence),
+                }
+                for sponsor_id, pack in packs
+            ),
+            fieldnames=_CSV_FIELDS,
+        )
+    else:
+        body = ndjson_stream(
+            {"athlete_id": payload.athlete_id, "sponsor_id": sponsor_id, **pack.model_dump()}
+            for sponsor_id, pack in packs
+        )
+
+    filename = f"outreach_{payload.athlete_id}.{payload.format}"
+    return StreamingResponse(
+        body,
+        media_type=_MEDIA_TYPES[payload.format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
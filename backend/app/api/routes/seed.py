@@ -1,11 +1,13 @@
 from fastapi import APIRouter
 
-from backend.app.db.session import engine
-from backend.app.services.seed_fake_data import SeedConfig, seed_fake_data
+from backend.app.db.session import get_engine
 
 router = APIRouter(prefix="/seed", tags=["seed"])
 
 
 @router.post("")
 def seed() -> dict[str, int]:
-    return seed_fake_data(engine=engine, config=SeedConfig())
+    # Imported lazily: Faker is heavy and only this rarely used route needs it.
+    from backend.app.services.seed_fake_data import SeedConfig, seed_fake_data
+
+    return seed_fake_data(engine=get_engine(), config=SeedConfig())
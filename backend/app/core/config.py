@@ -11,12 +11,46 @@ class Settings(BaseSettings):
     env: str = "local"
     log_level: str = "INFO"
     database_url: str
+    db_pool_size: int = 5
+    db_pool_warm_connections: int = 2  # opened during startup, before /ready
 
     generation_mode: str = "template"  # "template" | "llm"
     llm_provider: str = "ollama"       # only "ollama" for now
     ollama_base_url: str = "http://127.0.0.1:11434"
+    # Several inference hosts: "http://gpu-a:11434|8,http://gpu-b:11434" (|N = concurrency cap).
+    # Empty means ollama_base_url only.
+    ollama_backends: str = ""
+    ollama_backend_max_concurrency: int = 4
+    ollama_eject_after_failures: int = 3
+    ollama_health_interval_seconds: float = 10.0
     ollama_model: str = "qwen2.5:7b"
     ollama_temperature: float = 0.4
+    llm_warmup: bool = False           # pre-load the model at startup (llm mode only)
+    llm_connect_timeout_seconds: float = 3.0
+    llm_read_timeout_seconds: float = 90.0
+    llm_stream: bool = True            # validate JSON as tokens arrive, abort early
+    llm_stream_max_tokens: int = 1500  # per generation (also sent as num_predict)
+    llm_max_concurrency: int = 4       # parallel generations per variants request
+    llm_variant_timeout_seconds: float = 30.0  # shared deadline for a variants request
 
+    # Circuit breaker around Ollama calls (rolling window of the last N calls)
+    llm_breaker_window: int = 20
+    llm_breaker_min_calls: int = 5
+    llm_breaker_failure_rate: float = 0.5
+    llm_breaker_open_seconds: float = 30.0
+    llm_breaker_half_open_probes: int = 2
+    # Hedged retry: fire a second attempt once a call exceeds this latency percentile
+    llm_hedge_enabled: bool = False
+    llm_hedge_percentile: float = 95.0
+    llm_hedge_min_samples: int = 20
+    llm_hedge_max_ratio: float = 0.05  # at most this share of recent calls get hedged
 
-settings = Settings()
\ No newline at end of file
+    # Opt-in request profiling (GET /admin/profiles)
+    admin_token: str = ""              # X-Admin-Token; empty disables admin access
+    profile_header_enabled: bool = True  # "X-Profile: 1" + admin token profiles that request
+    profile_sample_rate: float = 0.0   # fraction of requests profiled automatically
+    profile_interval_ms: float = 5.0
+    profile_buffer_size: int = 50
+
+
+settings = Settings()
@@ -1,11 +1,38 @@
-from sqlalchemy import create_engine
+from functools import lru_cache
+
+from sqlalchemy import create_engine, text
 from sqlalchemy.engine import Engine
 
 from backend.app.core.config import settings
+from backend.app.services.profiling import install_query_timing
 
 
+@lru_cache(maxsize=1)
 def get_engine() -> Engine:
-    return create_engine(settings.database_url, pool_pre_ping=True)
+    # Built on first use (or by the startup warm-up), not at import time.
+    engine = create_engine(
+        settings.database_url,
+        pool_pre_ping=True,
+        pool_size=settings.db_pool_size,
+    )
+    install_query_timing(engine)
+    return engine
+
+
+def warm_pool(engine: Engine, connections: int) -> None:
+    # Check out N connections at once so the pool holds N live sockets afterwards.
+    opened = []
+    try:
+        for _ in range(max(0, min(connections, settings.db_pool_size))):
+            conn = engine.connect()
+            opened.append(conn)
+            conn.execute(text("SELECT 1"))
+    finally:
+        for conn in opened:
+            conn.close()
 
 
-engine = get_engine()
+def check_connection(engine: Engine) -> None:
+    # Cheap liveness query on a pooled connection.
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
@@ -1,11 +1,44 @@
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
 from fastapi import FastAPI
+from starlette.concurrency import run_in_threadpool
 
+from backend.app import IMPORT_STARTED
+from backend.app.api.routes.admin import router as admin_router
+from backend.app.api.routes.analytics import router as analytics_router
+from backend.app.api.routes.catalog import router as catalog_router
 from backend.app.api.routes.health import router as health_router
 from backend.app.api.routes.seed import router as seed_router
 from backend.app.api.routes.outreach import router as outreach_router
+from backend.app.core.config import settings
+from backend.app.db.session import get_engine
+from backend.app.services.llm_pool import get_llm_pool
+from backend.app.services.profiling import ProfilingMiddleware
+from backend.app.services.warmup import StartupState, warm_up
+
+IMPORT_SECONDS = time.perf_counter() - IMPORT_STARTED
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    app.state.startup = StartupState(import_seconds=IMPORT_SECONDS)
+    # Uvicorn only starts accepting traffic once this returns.
+    await run_in_threadpool(warm_up, app.state.startup)
+    if settings.generation_mode == "llm":
+        get_llm_pool().start()
+    yield
+    get_llm_pool().stop()
+    get_engine().dispose()
+
 
-app = FastAPI(title="Sponsorship Copilot API", version="0.1.0")
+app = FastAPI(title="Sponsorship Copilot API", version="0.1.0", lifespan=lifespan)
+app.add_middleware(ProfilingMiddleware)
 
 app.include_router(health_router)
 app.include_router(seed_router)
 app.include_router(outreach_router)
+app.include_router(analytics_router)
+app.include_router(catalog_router)
+app.include_router(admin_router)
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+from datetime import date, datetime
+from typing import Literal
+
 from pydantic import BaseModel, Field
 
 
@@ -35,6 +38,17 @@ class OutreachPackRequest(BaseModel):
     channel: str = Field(default="email", examples=["email"])
 
 
+class OutreachExportRequest(BaseModel):
+    athlete_id: str = Field(..., examples=["ath_001"])
+    locale: str = Field(default="en-GB", examples=["en-GB", "fr-FR"])
+    tone: str = Field(default="premium_warm", examples=["premium_warm"])
+    channel: str = Field(default="email", examples=["email"])
+    # Sponsor filter; each pack uses the sponsor's own market.
+    market: str | None = Field(default=None, examples=["UK", "FR"])
+    sector: str | None = Field(default=None, examples=["automotive"])
+    format: Literal["ndjson", "csv", "zip"] = "ndjson"
+
+
 class FitExplanation(BaseModel):
     feature: str
     impact: float
@@ -69,3 +83,99 @@ class OutreachPackResponse(BaseModel):
     recommended_assets: list[RecommendedAsset]
     locale: str
     market: str
+
+
+class OutreachVariantsRequest(BaseModel):
+    athlete_id: str = Field(..., examples=["ath_001"])
+    sponsor_id: str = Field(..., examples=["sp_001"])
+    locale: str = Field(default="en-GB", examples=["en-GB", "fr-FR"])
+    market: str = Field(default="UK", examples=["UK", "FR"])
+    tones: list[str] = Field(
+        default=["premium_warm"],
+        min_length=1,
+        max_length=12,
+        examples=[["premium_warm", "direct"]],
+    )
+    channels: list[str] = Field(
+        default=["email"], min_length=1, max_length=12, examples=[["email", "linkedin"]]
+    )
+    max_variants: int = Field(default=4, ge=1, le=12)
+
+
+class OutreachVariant(BaseModel):
+    tone: str
+    channel: str
+    email_outreach: EmailOutreach
+    one_pager_markdown: str
+    source: Literal["llm", "template"]
+
+
+class OutreachVariantsResponse(BaseModel):
+    fit_score: float
+    fit_explanations: list[FitExplanation]
+    talking_points: list[TalkingPoint]
+    variants: list[OutreachVariant]
+    evidence: list[EvidenceItem]
+    offer: Offer
+    measurement_plan: MeasurementPlan
+    recommended_assets: list[RecommendedAsset]
+    locale: str
+    market: str
+
+
+class OutcomeRateRow(BaseModel):
+    bucket_start: date
+    dimensions: dict[str, str]
+    total: int
+    replied: int
+    interested: int
+    reply_rate: float
+    interest_rate: float
+
+
+class OutcomeAnalyticsResponse(BaseModel):
+    bucket: str
+    group_by: list[str]
+    rows: list[OutcomeRateRow]
+
+
+class AthleteItem(BaseModel):
+    id: str
+    full_name: str
+    country: str
+    position: str
+    level: str
+    created_at: datetime
+
+
+class SponsorItem(BaseModel):
+    id: str
+    name: str
+    sector: str
+    market: str
+    budget_range: str
+    created_at: datetime
+
+
+class DocumentItem(BaseModel):
+    id: str
+    owner_type: str
+    owner_id: str
+    locale: str
+    title: str
+    created_at: datetime
+
+
+class AthletePage(BaseModel):
+    items: list[AthleteItem]
+    next_cursor: str | None
+
+
+class SponsorPage(BaseModel):
+    items: list[SponsorItem]
+    next_cursor: str | None
+
+
+class DocumentPage(BaseModel):
+    items: list[DocumentItem]
+    next_cursor: str | None
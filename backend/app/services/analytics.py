@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from datetime import date
+from typing import Any
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+# Whitelists: these are interpolated into SQL, never user strings.
+DIMENSIONS = ("sector", "position", "market", "channel")
+BUCKETS = ("day", "week", "month")
+
+
+def outcome_rates(
+    *,
+    engine: Engine,
+    group_by: list[str],
+    bucket: str,
+    since: date | None = None,
+    until: date | None = None,
+    filters: dict[str, str | None] | None = None,
+) -> list[dict[str, Any]]:
+    """Reply/interest rates per time bucket and dimension, read from interaction_rollups.
+
+    ``reply_rate`` counts any answer (``replied`` or ``interested``);
+    ``interest_rate`` counts ``interested`` only.
+    """
+    dims = [d for d in DIMENSIONS if d in group_by]
+    if bucket not in BUCKETS:
+        raise ValueError(f"Unknown bucket: {bucket}")
+
+    where = ["TRUE"]
+    params: dict[str, Any] = {"bucket": bucket}
+    if since is not None:
+        where.append("bucket_day >= :since")
+        params["since"] = since
+    if until is not None:
+        where.append("bucket_day < :until")
+        params["until"] = until
+    for dim, value in (filters or {}).items():
+        if dim in DIMENSIONS and value is not None:
+            where.append(f"{dim} = :{dim}")
+            params[dim] = value
+
+    dim_cols = "".join(f", {d}" for d in dims)
+    query = text(
+        f"""
+        SELECT
+          date_trunc(:bucket, bucket_day::timestamp)::date AS bucket_start{dim_cols},
+          SUM(total) AS total,
+          SUM(replied) AS replied,
+          SUM(interested) AS interested
+        FROM interaction_rollups
+        WHERE {" AND ".join(where)}
+        GROUP BY 1{dim_cols}
+        HAVING SUM(total) > 0
+        ORDER BY 1{dim_cols}
+        """
+    )
+
+    with engine.begin() as conn:
+        rows = conn.execute(query, params).mappings().all()
+
+    results: list[dict[str, Any]] = []
+    for row in rows:
+        total = int(row["total"])
+        replied = int(row["replied"])
+        interested = int(row["interested"])
+        results.append(
+            {
+                "bucket_start": row["bucket_start"],
+                "dimensions": {d: str(row[d]) for d in dims},
+                "total": total,
+                "replied": replied,
+                "interested": interested,
+                "reply_rate": (replied + interested) / total,
+                "interest_rate": interested / total,
+            }
+        )
+    return results
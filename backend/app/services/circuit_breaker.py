@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from functools import lru_cache
+from typing import Any
+
+from backend.app.core.config import settings
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Failure-rate circuit breaker with half-open probing.
+
+    closed: calls pass; opens when the failure rate over the last ``window`` calls
+    reaches ``failure_rate`` (after at least ``min_calls``).
+    open: calls are rejected instantly until ``open_seconds`` have passed.
+    half_open: up to ``half_open_probes`` calls pass; all succeeding closes the
+    circuit, any failure re-opens it.
+    """
+
+    def __init__(
+        self,
+        *,
+        window: int,
+        min_calls: int,
+        failure_rate: float,
+        open_seconds: float,
+        half_open_probes: int,
+    ) -> None:
+        self._outcomes: deque[bool] = deque(maxlen=window)
+        self._min_calls = min_calls
+        self._failure_rate = failure_rate
+        self._open_seconds = open_seconds
+        self._half_open_probes = half_open_probes
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._probes_admitted = 0
+        self._probes_succeeded = 0
+
+    def _transition(self, state: str) -> None:
+        self._state = state
+        self._probes_admitted = 0
+        self._probes_succeeded = 0
+        if state == OPEN:
+            self._opened_at = time.monotonic()
+        if state == CLOSED:
+            self._outcomes.clear()
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self._state == OPEN:
+                if time.monotonic() - self._opened_at < self._open_seconds:
+                    return False
+                self._transition(HALF_OPEN)
+            if self._state == HALF_OPEN:
+                if self._probes_admitted >= self._half_open_probes:
+                    return False
+                self._probes_admitted += 1
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self._state == HALF_OPEN:
+                self._probes_succeeded += 1
+                if self._probes_succeeded >= self._half_open_probes:
+                    self._transition(CLOSED)
+                return
+            self._outcomes.append(True)
+
+    def record_failure(self) -> None:
+        with self._lock:
+            if self._state == HALF_OPEN:
+                self._transition(OPEN)
+                return
+            self._outcomes.append(False)
+            failures = self._outcomes.count(False)
+            if (
+                self._state == CLOSED
+                and len(self._outcomes) >= self._min_calls
+                and failures / len(self._outcomes) >= self._failure_rate
+            ):
+                self._transition(OPEN)
+
+    def record_ignored(self) -> None:
+        # A call that was abandoned on our side (e.g. a cancelled hedge): free its
+        # half-open probe slot without counting it either way.
+        with self._lock:
+            if self._state == HALF_OPEN and self._probes_admitted > 0:
+                self._probes_admitted -= 1
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            calls = len(self._outcomes)
+            failures = self._outcomes.count(False)
+            retry_in = (
+                max(0.0, self._open_seconds - (time.monotonic() - self._opened_at))
+                if self._state == OPEN
+                else None
+            )
+            return {
+                "state": self._state,
+                "window_calls": calls,
+                "window_failure_rate": failures / calls if calls else 0.0,
+                "retry_in_seconds": retry_in,
+            }
+
+
+@lru_cache(maxsize=1)
+def get_llm_breaker() -> CircuitBreaker:
+    return CircuitBreaker(
+        window=settings.llm_breaker_window,
+        min_calls=settings.llm_breaker_min_calls,
+        failure_rate=settings.llm_breaker_failure_rate,
+        open_seconds=settings.llm_breaker_open_seconds,
+        half_open_probes=settings.llm_breaker_half_open_probes,
+    )
@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import re
+
+_WHITESPACE = " \t\n\r"
+_LITERALS = ("true", "false", "null")
+_NUMBER_CHARS = set("+-0123456789.eE")
+_NUMBER_RE = re.compile(r"-?(0|[1-9]\d*)(\.\d+)?([eE][+-]?\d+)?\Z")
+_ESCAPES = set('"\\/bfnrt')
+_HEX = set("0123456789abcdefABCDEF")
+
+
+class JsonStreamError(ValueError):
+    pass
+
+
+class IncrementalJsonValidator:
+    """Checks, chunk by chunk, that streamed text can still become the JSON we want.
+
+    The document must be a single object; ``required_keys`` must appear at its top
+    level with string values. ``feed`` raises ``JsonStreamError`` as soon as the text
+    seen so far cannot be completed into such a document, and ``complete`` turns true
+    once the top-level object is closed.
+    """
+
+    def __init__(self, required_keys: tuple[str, ...] = ()) -> None:
+        self.required_keys = set(required_keys)
+        self.seen_keys: set[str] = set()
+        self._stack: list[str] = []
+        # value | value_or_end | key | key_or_end | colon | comma_or_end | done
+        self._expect = "value"
+        self._in_string = False
+        self._string_is_key = False
+        self._escape = False
+        self._hex_left = 0
+        self._key_chars: list[str] = []
+        self._current_key: str | None = None
+        self._scalar = ""
+
+    @property
+    def complete(self) -> bool:
+        return self._expect == "done"
+
+    def feed(self, chunk: str) -> None:
+        for ch in chunk:
+            self._feed_char(ch)
+
+    def _feed_char(self, ch: str) -> None:
+        if self._in_string:
+            self._feed_string(ch)
+            return
+
+        if self._scalar:
+            if ch in _NUMBER_CHARS or ch.isalpha():
+                self._scalar += ch
+                self._check_scalar(final=False)
+                return
+            self._check_scalar(final=True)
+            self._scalar = ""
+            self._value_done()
+
+        if ch in _WHITESPACE:
+            return
+
+        expect = self._expect
+        if expect == "done":
+            raise JsonStreamError("Trailing data after the JSON object.")
+        if expect in ("value", "value_or_end"):
+            if expect == "value_or_end" and ch == "]":
+                self._close("]")
+            else:
+                self._start_value(ch)
+        elif expect in ("key", "key_or_end"):
+            if expect == "key_or_end" and ch == "}":
+                self._close("}")
+            elif ch == '"':
+                self._in_string = True
+                self._string_is_key = True
+                self._key_chars = []
+            else:
+                raise JsonStreamError(f"Expected an object key, got {ch!r}.")
+        elif expect == "colon":
+            if ch != ":":
+                raise JsonStreamError(f"Expected ':', got {ch!r}.")
+            self._expect = "value"
+        elif expect == "comma_or_end":
+            if ch == ",":
+                self._expect = "key" if self._stack[-1] == "{" else "value"
+            elif ch in "}]":
+                self._close(ch)
+            else:
+                raise JsonStreamError(f"Expected ',' or a closing bracket, got {ch!r}.")
+
+    def _start_value(self, ch: str) -> None:
+        if not self._stack and ch != "{":
+            raise JsonStreamError("Top-level JSON value must be an object.")
+        if (
+            len(self._stack) == 1
+            and self._current_key in self.required_keys
+            and ch != '"'
+        ):
+            raise JsonStreamError(f"Key {self._current_key!r} must be a string.")
+
+        if ch == "{":
+            self._stack.append("{")
+            self._expect = "key_or_end"
+        elif ch == "[":
+            self._stack.append("[")
+            self._expect = "value_or_end"
+        elif ch == '"':
+            self._in_string = True
+            self._string_is_key = False
+        elif ch == "-" or ch.isdigit() or ch in "tfn":
+            self._scalar = ch
+            self._check_scalar(final=False)
+        else:
+            raise JsonStreamError(f"Unexpected character {ch!r}.")
+
+    def _feed_string(self, ch: str) -> None:
+        if self._hex_left:
+            if ch not in _HEX:
+                raise JsonStreamError("Invalid \\u escape.")
+            self._hex_left -= 1
+        elif self._escape:
+            if ch == "u":
+                self._hex_left = 4
+            elif ch not in _ESCAPES:
+                raise JsonStreamError(f"Invalid escape \\{ch}.")
+            self._escape = False
+        elif ch == "\\":
+            self._escape = True
+        elif ch == '"':
+            self._in_string = False
+            if self._string_is_key:
+                if len(self._stack) == 1:
+                    self._current_key = "".join(self._key_chars)
+                    self.seen_keys.add(self._current_key)
+                self._expect = "colon"
+            else:
+                self._value_done()
+            return
+        elif ord(ch) < 0x20:
+            raise JsonStreamError("Unescaped control character in string.")
+
+        if self._string_is_key and len(self._stack) == 1:
+            self._key_chars.append(ch)
+
+    def _check_scalar(self, *, final: bool) -> None:
+        s = self._scalar
+        if s[0] in "tfn":
+            ok = s in _LITERALS if final else any(lit.startswith(s) for lit in _LITERALS)
+        else:
+            ok = bool(_NUMBER_RE.match(s)) if final else all(c in _NUMBER_CHARS for c in s)
+        if not ok:
+            raise JsonStreamError(f"Invalid literal {s!r}.")
+
+    def _close(self, ch: str) -> None:
+        opener = self._stack.pop()
+        if (opener, ch) not in (("{", "}"), ("[", "]")):
+            raise JsonStreamError(f"Mismatched {ch!r}.")
+        self._value_done()
+
+    def _value_done(self) -> None:
+        if self._stack:
+            self._expect = "comma_or_end"
+            return
+        missing = self.required_keys - self.seen_keys
+        if missing:
+            raise JsonStreamError(f"Missing keys: {', '.join(sorted(missing))}.")
+        self._expect = "done"
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from typing import Any
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+# Keyset (cursor) pagination on the text primary key `id`. Table and column names
+# come from the constants below, never from user input; filter values are bound.
+LISTABLE: dict[str, tuple[str, ...]] = {
+    "athletes": ("id", "full_name", "country", "position", "level", "created_at"),
+    "sponsors": ("id", "name", "sector", "market", "budget_range", "created_at"),
+    "documents": ("id", "owner_type", "owner_id", "locale", "title", "created_at"),
+}
+
+
+def list_page(
+    engine: Engine,
+    *,
+    table: str,
+    filters: dict[str, str | None],
+    after: str | None,
+    limit: int,
+) -> tuple[list[dict[str, Any]], str | None]:
+    """Return up to ``limit`` rows with ``id > after`` and the cursor for the next page."""
+    columns = LISTABLE[table]
+
+    where = ["id > :after"]
+    params: dict[str, Any] = {"after": after or "", "limit": limit + 1}
+    for column, value in filters.items():
+        if column not in columns:
+            raise ValueError(f"Cannot filter {table} on {column}")
+        if value is not None:
+            where.append(f"{column} = :{column}")
+            params[column] = value
+
+    query = text(
+        f"""
+        SELECT {", ".join(columns)}
+        FROM {table}
+        WHERE {" AND ".join(where)}
+        ORDER BY id
+        LIMIT :limit
+        """
+    )
+
+    with engine.begin() as conn:
+        rows = [dict(r) for r in conn.execute(query, params).mappings().all()]
+
+    # One extra row tells us whether another page exists without a COUNT(*).
+    next_cursor = str(rows[limit - 1]["id"]) if len(rows) > limit else None
+    return rows[:limit], next_cursor
@@ -1,34 +1,310 @@
 from __future__ import annotations
 
 import json
+import math
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from functools import lru_cache
 from typing import Any
 
 import requests
 
 from backend.app.core.config import settings
+from backend.app.services.circuit_breaker import get_llm_breaker
+from backend.app.services.json_stream import IncrementalJsonValidator, JsonStreamError
+from backend.app.services.llm_pool import NoLlmBackendError, get_llm_pool
+from backend.app.services.profiling import timed
 
 
 class LlmError(RuntimeError):
     pass
 
 
-def ollama_generate_json(*, prompt: str) -> dict[str, Any]:
-    url = f"{settings.ollama_base_url}/api/generate"
+class LlmTimeoutError(LlmError):
+    """The backend was too slow: counts against its health, unlike a bad model output."""
+
+
+class LlmCancelledError(LlmError):
+    """Another hedged attempt already answered; neither a success nor a failure."""
+
+
+class LlmDeadlineError(LlmError):
+    """The caller's own deadline passed first; says nothing about the backend."""
+
+
+class _Attempt:
+    # Lets the hedging thread see when an attempt actually started and stop a loser.
+    def __init__(self) -> None:
+        self.started = threading.Event()
+        self.cancel = threading.Event()
+
+
+class _HedgeBudget:
+    """Caps hedged retries to ``max_ratio`` of the last ``window`` hedge-eligible calls."""
+
+    def __init__(self, window: int = 100) -> None:
+        self._calls: deque[bool] = deque(maxlen=window)
+        self._window = window
+        self._lock = threading.Lock()
+
+    def try_hedge(self, max_ratio: float) -> bool:
+        with self._lock:
+            allowed = sum(self._calls) < max(1, int(max_ratio * self._window))
+            self._calls.append(allowed)
+            return allowed
+
+    def note_unhedged(self) -> None:
+        with self._lock:
+            self._calls.append(False)
+
+
+class _LatencyWindow:
+    """Latencies of recent successful generations, used to time hedged retries."""
+
+    def __init__(self, size: int = 200) -> None:
+        self._samples: deque[float] = deque(maxlen=size)
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float) -> None:
+        with self._lock:
+            self._samples.append(seconds)
+
+    def percentile(self, pct: float, *, min_samples: int) -> float | None:
+        with self._lock:
+            if len(self._samples) < min_samples:
+                return None
+            ordered = sorted(self._samples)
+        index = min(len(ordered) - 1, math.ceil(pct / 100 * len(ordered)) - 1)
+        return ordered[max(0, index)]
+
+
+_latencies = _LatencyWindow()
+_hedge_budget = _HedgeBudget()
+
+
+@lru_cache(maxsize=1)
+def _hedge_executor() -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(max_workers=32, thread_name_prefix="llm-hedge")
+
+
+def hedge_delay_seconds() -> float | None:
+    if not settings.llm_hedge_enabled:
+        return None
+    return _latencies.percentile(
+        settings.llm_hedge_percentile, min_samples=settings.llm_hedge_min_samples
+    )
+
+
+def _read_stream(
+    resp: requests.Response,
+    *,
+    required_keys: tuple[str, ...],
+    deadline: float,
+    caller_deadline: float | None = None,
+    cancel: threading.Event | None = None,
+) -> str:
+    # Ollama streams one NDJSON event per token; stop reading (which closes the
+    # connection and stops generation) as soon as the output is complete or doomed.
+    validator = IncrementalJsonValidator(required_keys)
+    parts: list[str] = []
+    tokens = 0
+
+    for line in resp.iter_lines():
+        if not line:
+            continue
+        try:
+            event = json.loads(line)
+        except json.JSONDecodeError as exc:
+            raise LlmError(f"Unreadable Ollama stream event: {line[:200]!r}") from exc
+        chunk = str(event.get("response", ""))
+        if chunk:
+            tokens += 1
+            if tokens > settings.llm_stream_max_tokens:
+                raise LlmError(
+                    f"Aborted generation: over {settings.llm_stream_max_tokens} tokens."
+                )
+            try:
+                validator.feed(chunk)
+            except JsonStreamError as exc:
+                raise LlmError(f"Aborted generation: {exc} Raw: {''.join(parts)[:200]}") from exc
+            parts.append(chunk)
+            if validator.complete:
+                break
+        if cancel is not None and cancel.is_set():
+            raise LlmCancelledError("Cancelled: another hedged attempt answered first.")
+        now = time.monotonic()
+        if now > deadline:
+            raise LlmTimeoutError("Aborted generation: read timeout exceeded.")
+        if caller_deadline is not None and now > caller_deadline:
+            raise LlmDeadlineError("Aborted generation: caller deadline passed.")
+        if event.get("done"):
+            break
+
+    if not validator.complete:
+        raise LlmError(
+            f"Model output ended before the JSON was complete. Raw: {''.join(parts)[:200]}"
+        )
+    return "".join(parts)
+
+
+def _post_generate(
+    payload: dict[str, Any],
+    read_timeout: float,
+    required_keys: tuple[str, ...],
+    caller_deadline: float | None = None,
+    attempt: _Attempt | None = None,
+) -> dict[str, Any]:
+    # One attempt: breaker check, least-loaded backend, separate connect/read timeouts.
+    # ``read_timeout`` is the backend's budget (overrunning it is a backend failure);
+    # ``caller_deadline`` is the caller's (overrunning it is neutral).
+    if attempt is not None:
+        attempt.started.set()
+    wait_seconds = read_timeout
+    if caller_deadline is not None:
+        wait_seconds = min(wait_seconds, caller_deadline - time.monotonic())
+        if wait_seconds <= 0:
+            raise LlmDeadlineError("Caller deadline passed before the Ollama call.")
+    breaker = get_llm_breaker()
+    if not breaker.allow():
+        raise LlmError("LLM circuit is open; skipping Ollama call.")
+
+    pool = get_llm_pool()
+    try:
+        with pool.acquire(wait_seconds=wait_seconds) as backend:
+            # The read deadline starts once we hold a slot: waiting for one is our
+            # own queueing, not the backend being slow.
+            started = time.monotonic()
+            try:
+                with requests.post(
+                    f"{backend.url}/api/generate",
+                    json=payload,
+                    timeout=(settings.llm_connect_timeout_seconds, read_timeout),
+                    stream=payload["stream"],
+                ) as resp:
+                    resp.raise_for_status()
+                    if payload["stream"]:
+                        try:
+                            raw = _read_stream(
+                                resp,
+                                required_keys=required_keys,
+                                deadline=started + read_timeout,
+                                caller_deadline=caller_deadline,
+                                cancel=attempt.cancel if attempt else None,
+                            )
+                        except (LlmCancelledError, LlmDeadlineError):
+                            breaker.record_ignored()
+                            raise
+                        except LlmTimeoutError:
+                            pool.mark_failure(backend)
+                            breaker.record_failure()
+                            raise
+                        except LlmError:
+                            # The backend answered; only the model output was unusable.
+                            pool.mark_success(backend)
+                            breaker.record_success()
+                            raise
+                        data = {"response": raw}
+                    else:
+                        data = resp.json()
+            except requests.RequestException as exc:
+                pool.mark_failure(backend)
+                breaker.record_failure()
+                raise LlmError(f"Ollama request failed ({backend.url}): {exc}") from exc
+            pool.mark_success(backend)
+    except NoLlmBackendError as exc:
+        # No request reached a backend; the pool tracks backend health itself.
+        breaker.record_ignored()
+        raise LlmError(str(exc)) from exc
+
+    breaker.record_success()
+    _latencies.record(time.monotonic() - started)
+    return data
+
+
+def _post_hedged(
+    payload: dict[str, Any],
+    read_timeout: float,
+    required_keys: tuple[str, ...],
+    caller_deadline: float | None,
+) -> dict[str, Any]:
+    delay = hedge_delay_seconds()
+    if delay is None:
+        return _post_generate(payload, read_timeout, required_keys, caller_deadline)
+
+    executor = _hedge_executor()
+    primary = _Attempt()
+    primary_future = executor.submit(
+        _post_generate, payload, read_timeout, required_keys, caller_deadline, primary
+    )
+    # Time spent queued for an executor thread does not count toward the hedge delay.
+    primary.started.wait(timeout=read_timeout)
+    done, _ = wait([primary_future], timeout=delay)
+    if done:
+        _hedge_budget.note_unhedged()
+        return primary_future.result()
+    if not _hedge_budget.try_hedge(settings.llm_hedge_max_ratio):
+        # Hedge budget spent (e.g. every backend is slow): do not add more load.
+        return primary_future.result()
+
+    # Slower than the configured percentile: race a second attempt (the pool will
+    # usually route it to another backend). The first answer cancels the other one;
+    # streamed attempts stop at their next token, non-streamed ones run to completion.
+    hedge = _Attempt()
+    attempts = {
+        primary_future: primary,
+        executor.submit(
+            _post_generate, payload, read_timeout, required_keys, caller_deadline, hedge
+        ): hedge,
+    }
+    pending = set(attempts)
+    last_exc: LlmError | None = None
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            try:
+                result = future.result()
+            except LlmError as exc:
+                last_exc = exc
+                continue
+            for loser in pending:
+                attempts[loser].cancel.set()
+            return result
+    raise last_exc or LlmError("Hedged Ollama request failed.")
+
+
+def ollama_generate_json(
+    *,
+    prompt: str,
+    timeout: float | None = None,
+    deadline: float | None = None,
+    required_keys: tuple[str, ...] = (),
+) -> dict[str, Any]:
+    """Generate and parse one JSON completion.
+
+    ``timeout`` is the backend read timeout (default ``llm_read_timeout_seconds``);
+    ``deadline`` is an optional ``time.monotonic()`` cut-off of the caller, which
+    raises ``LlmDeadlineError`` without counting against the backend.
+    """
     payload = {
         "model": settings.ollama_model,
         "prompt": prompt,
-        "stream": False,
+        "stream": settings.llm_stream,
         "format": "json",
-        "options": {"temperature": settings.ollama_temperature},
+        "options": {
+            "temperature": settings.ollama_temperature,
+            "num_predict": settings.llm_stream_max_tokens,
+        },
     }
 
-    try:
-        resp = requests.post(url, json=payload, timeout=90)
-        resp.raise_for_status()
-    except requests.RequestException as exc:
-        raise LlmError(f"Ollama request failed: {exc}") from exc
-
-    data = resp.json()
+    with timed("llm"):
+        data = _post_hedged(
+            payload,
+            timeout or settings.llm_read_timeout_seconds,
+            required_keys,
+            deadline,
+        )
     raw = data.get("response", "")
     if not raw:
         raise LlmError("Ollama returned empty response.")
@@ -36,4 +312,20 @@ def ollama_generate_json(*, prompt: str) -> dict[str, Any]:
     try:
         return json.loads(raw)
     except json.JSONDecodeError as exc:
-        raise LlmError(f"Model did not return valid JSON. Raw: {raw[:200]}") from exc
\ No newline at end of file
+        raise LlmError(f"Model did not return valid JSON. Raw: {raw[:200]}") from exc
+
+
+def ollama_preload() -> None:
+    # An empty generate request makes Ollama load the model into memory (on every backend).
+    payload = {"model": settings.ollama_model, "keep_alive": "30m"}
+
+    for backend in get_llm_pool().backends:
+        try:
+            resp = requests.post(
+                f"{backend.url}/api/generate",
+                json=payload,
+                timeout=(settings.llm_connect_timeout_seconds, 300),
+            )
+            resp.raise_for_status()
+        except requests.RequestException as exc:
+            raise LlmError(f"Ollama preload failed ({backend.url}): {exc}") from exc
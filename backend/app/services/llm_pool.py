@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
+
+import requests
+
+from backend.app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class NoLlmBackendError(RuntimeError):
+    pass
+
+
+@dataclass
+class LlmBackend:
+    url: str
+    max_concurrency: int
+    outstanding: int = 0
+    healthy: bool = True
+    consecutive_failures: int = 0
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "url": self.url,
+            "healthy": self.healthy,
+            "outstanding": self.outstanding,
+            "max_concurrency": self.max_concurrency,
+            "consecutive_failures": self.consecutive_failures,
+        }
+
+
+def parse_backends(spec: str, default_concurrency: int) -> list[LlmBackend]:
+    """Parse ``"http://a:11434|8,http://b:11434"`` (``|N`` = per-backend concurrency cap)."""
+    backends: list[LlmBackend] = []
+    for item in spec.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        url, _, cap = item.partition("|")
+        backends.append(
+            LlmBackend(
+                url=url.rstrip("/"),
+                max_concurrency=int(cap) if cap else default_concurrency,
+            )
+        )
+    return backends
+
+
+class LlmBackendPool:
+    """Least-outstanding-requests routing over several Ollama hosts.
+
+    A backend is ejected after ``eject_after_failures`` consecutive transport
+    failures; the background health check re-admits it once ``/api/tags`` answers.
+    """
+
+    def __init__(
+        self,
+        backends: list[LlmBackend],
+        *,
+        eject_after_failures: int,
+        health_interval_seconds: float,
+    ) -> None:
+        if not backends:
+            raise ValueError("LlmBackendPool needs at least one backend")
+        self.backends = backends
+        self._eject_after_failures = eject_after_failures
+        self._health_interval_seconds = health_interval_seconds
+        self._cond = threading.Condition()
+        self._next = 0  # rotates ties so equal backends share load
+        self._stop = threading.Event()
+        self._health_thread: threading.Thread | None = None
+
+    def _pick(self) -> LlmBackend | None:
+        candidates = [
+            b for b in self.backends if b.healthy and b.outstanding < b.max_concurrency
+        ]
+        if not candidates:
+            return None
+        self._next += 1
+        offset = self._next % len(candidates)
+        rotated = candidates[offset:] + candidates[:offset]
+        return min(rotated, key=lambda b: b.outstanding / b.max_concurrency)
+
+    @contextmanager
+    def acquire(self, *, wait_seconds: float) -> Iterator[LlmBackend]:
+        deadline = time.monotonic() + wait_seconds
+        with self._cond:
+            while True:
+                if not any(b.healthy for b in self.backends):
+                    raise NoLlmBackendError("No healthy LLM backend")
+                backend = self._pick()
+                if backend is not None:
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise NoLlmBackendError("All LLM backends are at capacity")
+                self._cond.wait(timeout=remaining)
+            backend.outstanding += 1
+
+        try:
+            yield backend
+        finally:
+            with self._cond:
+                backend.outstanding -= 1
+                self._cond.notify()
+
+    def mark_success(self, backend: LlmBackend) -> None:
+        with self._cond:
+            backend.consecutive_failures = 0
+
+    def mark_failure(self, backend: LlmBackend) -> None:
+        with self._cond:
+            backend.consecutive_failures += 1
+            if backend.healthy and backend.consecutive_failures >= self._eject_after_failures:
+                backend.healthy = False
+                logger.warning("Ejecting LLM backend %s", backend.url)
+
+    def check_health(self) -> None:
+        for backend in self.backends:
+            try:
+                requests.get(f"{backend.url}/api/tags", timeout=2).raise_for_status()
+                ok = True
+            except requests.RequestException:
+                ok = False
+
+            with self._cond:
+                if ok and not backend.healthy:
+                    logger.info("Re-admitting LLM backend %s", backend.url)
+                    backend.consecutive_failures = 0
+                    self._cond.notify_all()
+                elif not ok and backend.healthy:
+                    logger.warning("LLM backend %s failed its health check", backend.url)
+                backend.healthy = ok
+
+    def _health_loop(self) -> None:
+        while not self._stop.wait(self._health_interval_seconds):
+            self.check_health()
+
+    def start(self) -> None:
+        if self._health_thread is None:
+            self._stop.clear()
+            self._health_thread = threading.Thread(
+                target=self._health_loop, name="llm-health", daemon=True
+            )
+            self._health_thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._health_thread is not None:
+            self._health_thread.join(timeout=5)
+            self._health_thread = None
+
+    def snapshot(self) -> list[dict[str, Any]]:
+        with self._cond:
+            return [b.snapshot() for b in self.backends]
+
+
+@lru_cache(maxsize=1)
+def get_llm_pool() -> LlmBackendPool:
+    backends = parse_backends(
+        settings.ollama_backends or settings.ollama_base_url,
+        settings.ollama_backend_max_concurrency,
+    )
+    return LlmBackendPool(
+        backends,
+        eject_after_failures=settings.ollama_eject_after_failures,
+        health_interval_seconds=settings.ollama_health_interval_seconds,
+    )
@@ -1,7 +1,14 @@
 from __future__ import annotations
 
+import contextvars
+import itertools
 import random
-from typing import Any
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from dataclasses import dataclass
+from typing import Any, Literal
 
 from sqlalchemy import text
 from sqlalchemy.engine import Engine
@@ -74,26 +81,31 @@ def _pick_evidence(engine: Engine, locale: str, limit: int = 4) -> list[Evidence
     return evidence
 
 
-def build_outreach_pack(
+@dataclass(frozen=True)
+class PackBase:
+    """Everything in a pack that does not depend on tone/channel (computed once)."""
+
+    athlete: dict[str, Any]
+    sponsor: dict[str, Any]
+    fit_score: float
+    fit_explanations: list[FitExplanation]
+    talking_points: list[TalkingPoint]
+    evidence: list[EvidenceItem]
+    offer_packages: list[tuple[str, list[str], str]]
+    measurement_plan: dict[str, Any]
+    recommended_assets: list[dict[str, str]]
+    template_email: EmailOutreach
+    template_one_pager: str
+
+
+def build_pack_base(
     *,
     engine: Engine,
     athlete_id: str,
     sponsor_id: str,
     locale: str,
     market: str,
-    tone: str,
-    channel: str,
-) -> tuple[
-    float,
-    list[FitExplanation],
-    list[TalkingPoint],
-    EmailOutreach,
-    str,
-    list[EvidenceItem],
-    list[tuple[str, list[str], str]],
-    dict[str, Any],
-    list[dict[str, str]],
-]:
+) -> PackBase:
     athlete_query = text(
         """
         SELECT id, full_name, country, position, level
@@ -205,7 +217,7 @@ def build_outreach_pack(
     evidence_ids = [e.id for e in evidence]
 
     # -------------------------------
-    # 1) TEMPLATE FIRST (always defined)
+    # Template copy (always defined; the LLM may override it per variant)
     # -------------------------------
     if locale.startswith("fr"):
         subject = (
@@ -316,22 +328,116 @@ def build_outreach_pack(
             ),
         ]
 
-    email = EmailOutreach(subject=subject, body=body)
+    return PackBase(
+        athlete=dict(athlete),
+        sponsor=dict(sponsor),
+        fit_score=fit_score,
+        fit_explanations=fit_explanations,
+        talking_points=talking_points,
+        evidence=evidence,
+        offer_packages=offer_packages,
+        measurement_plan=measurement_plan,
+        recommended_assets=recommended_assets,
+        template_email=EmailOutreach(subject=subject, body=body),
+        template_one_pager=one_pager,
+    )
+
 
-    # -------------------------------
-    # 2) OPTIONAL LLM OVERRIDE (no early return!)
-    # -------------------------------
-    if settings.generation_mode == "llm" and settings.llm_provider == "ollama":
-        evidence_block = "\n".join(
-            [f"- ({e.id}) {e.title}: {e.snippet}" for e in evidence]
-        )
-        system_style = (
-            "French business tone. Short, confident, measurable. No exaggeration."
-            if locale.startswith("fr")
-            else "UK business tone. Clear, concise, premium. No exaggeration."
+# (greeting, sign-off) per tone; "premium_warm" matches the base template above.
+_TONE_FRAMES: dict[str, dict[str, tuple[str, str]]] = {
+    "fr": {
+        "premium_warm": ("Bonjour {Prénom},", "Bien cordialement,"),
+        "direct": ("Bonjour {Prénom},", "Merci,"),
+        "formal": ("Madame, Monsieur,", "Je vous prie d’agréer mes salutations distinguées,"),
+    },
+    "en": {
+        "premium_warm": ("Hi {FirstName},", "Best,"),
+        "direct": ("Hi {FirstName},", "Thanks,"),
+        "formal": ("Dear {FirstName},", "Kind regards,"),
+    },
+}
+_SHORT_CHANNELS = {"linkedin", "dm", "sms", "whatsapp"}
+
+
+def _template_email(*, base: PackBase, locale: str, tone: str, channel: str) -> EmailOutreach:
+    """Template copy for one (tone, channel).
+
+    Tone sets greeting and sign-off; channel sets length and call to action
+    (full email, short message or call script).
+    """
+    lang = "fr" if locale.startswith("fr") else "en"
+    frames = _TONE_FRAMES[lang]
+    greeting, signoff = frames.get(tone, frames["premium_warm"])
+    default_greeting, default_signoff = frames["premium_warm"]
+    sponsor_name = base.sponsor["name"]
+    athlete_name = base.athlete["full_name"]
+
+    if channel == "call":
+        if lang == "fr":
+            subject = f"Script d’appel : {sponsor_name} × {athlete_name}"
+            body = (
+                f"1) Intro : qui nous sommes, pourquoi {sponsor_name} maintenant\n"
+                f"2) Angle : dynamique de {athlete_name}, narratif performance & précision\n"
+                "3) Offre : pilote 2 semaines (journée de contenu, vidéo principale, "
+                "stories avec CTA)\n"
+                "4) Qualifier : objectif notoriété ou drive-to-store ?\n"
+                "5) Prochaine étape : caler un échange de 15 minutes\n"
+            )
+        else:
+            subject = f"Call script: {sponsor_name} × {athlete_name}"
+            body = (
+                f"1) Intro: who we are, why {sponsor_name} now\n"
+                f"2) Angle: {athlete_name}'s momentum, precision & discipline narrative\n"
+                "3) Offer: 2-week pilot (content day, hero reel, CTA stories)\n"
+                "4) Qualify: awareness or drive-to-store?\n"
+                "5) Next step: book a 15-minute follow-up\n"
+            )
+        return EmailOutreach(subject=subject, body=body)
+
+    if channel in _SHORT_CHANNELS:
+        if lang == "fr":
+            pitch = (
+                f"{athlete_name} × {sponsor_name} : un pilote de 2 semaines, mesurable "
+                "(journée de contenu, vidéo principale, stories avec lien/code unique).\n\n"
+                "Un échange rapide de 15 minutes la semaine prochaine ?\n\n"
+            )
+        else:
+            pitch = (
+                f"{athlete_name} × {sponsor_name}: a measurable 2-week pilot "
+                "(content day, hero reel, CTA stories with a unique link/code).\n\n"
+                "Open to a quick 15-minute chat next week?\n\n"
+            )
+        return EmailOutreach(
+            subject=base.template_email.subject,
+            body=f"{greeting}\n\n{pitch}{signoff}\nDaniel\n",
         )
 
-        prompt = f"""\
+    body = base.template_email.body.replace(default_greeting, greeting, 1).replace(
+        f"\n{default_signoff}\nDaniel\n", f"\n{signoff}\nDaniel\n"
+    )
+    return EmailOutreach(subject=base.template_email.subject, body=body)
+
+
+REQUIRED_LLM_KEYS = ("subject", "body", "one_pager_markdown")
+
+
+def _llm_enabled() -> bool:
+    return settings.generation_mode == "llm" and settings.llm_provider == "ollama"
+
+
+def _build_prompt(*, base: PackBase, locale: str, tone: str, channel: str) -> str:
+    athlete = base.athlete
+    sponsor = base.sponsor
+    evidence_block = "\n".join(
+        [f"- ({e.id}) {e.title}: {e.snippet}" for e in base.evidence]
+    )
+    system_style = (
+        "French business tone. Short, confident, measurable. No exaggeration."
+        if locale.startswith("fr")
+        else "UK business tone. Clear, concise, premium. No exaggeration."
+    )
+
+    return f"""\
 You are Sponsorship Copilot. Write an outreach email + a one-page proposal.
 Rules:
 - Output MUST be valid JSON with keys: subject, body, one_pager_markdown.
@@ -356,16 +462,77 @@ Evidence (internal):
 
 Style:
 {system_style}
+Tone: {tone}
+Channel: {channel} (adapt length and call-to-action to this channel)
 """.strip()
 
+
+def _llm_copy(
+    *,
+    base: PackBase,
+    locale: str,
+    tone: str,
+    channel: str,
+    deadline: float | None = None,
+) -> tuple[EmailOutreach, str]:
+    # ``deadline`` bounds this request only; the backend keeps its own read timeout.
+    prompt = _build_prompt(base=base, locale=locale, tone=tone, channel=channel)
+    llm_json = ollama_generate_json(
+        prompt=prompt, deadline=deadline, required_keys=REQUIRED_LLM_KEYS
+    )
+    try:
+        email = EmailOutreach(
+            subject=str(llm_json["subject"]),
+            body=str(llm_json["body"]),
+        )
+        one_pager = str(llm_json["one_pager_markdown"])
+    except (KeyError, TypeError) as exc:
+        raise LlmError(f"Model output is missing keys: {exc}") from exc
+    return email, one_pager
+
+
+def build_outreach_pack(
+    *,
+    engine: Engine,
+    athlete_id: str,
+    sponsor_id: str,
+    locale: str,
+    market: str,
+    tone: str,
+    channel: str,
+) -> tuple[
+    float,
+    list[FitExplanation],
+    list[TalkingPoint],
+    EmailOutreach,
+    str,
+    list[EvidenceItem],
+    list[tuple[str, list[str], str]],
+    dict[str, Any],
+    list[dict[str, str]],
+]:
+    # -------------------------------
+    # 1) TEMPLATE FIRST (always defined)
+    # -------------------------------
+    base = build_pack_base(
+        engine=engine,
+        athlete_id=athlete_id,
+        sponsor_id=sponsor_id,
+        locale=locale,
+        market=market,
+    )
+    email = _template_email(base=base, locale=locale, tone=tone, channel=channel)
+    one_pager = base.template_one_pager
+
+    # -------------------------------
+    # 2) OPTIONAL LLM OVERRIDE (no early return!)
+    # -------------------------------
+    if _llm_enabled():
         try:
-            llm_json = ollama_generate_json(prompt=prompt)
-            email = EmailOutreach(
-                subject=str(llm_json["subject"]),
-                body=str(llm_json["body"]),
+            email, one_pager = _llm_copy(
+                base=base, locale=locale, tone=tone, channel=channel
             )
-            one_pager = str(llm_json["one_pager_markdown"])
-        except (KeyError, TypeError, LlmError):
+        except LlmError:
             # fallback to template
             pass
 
@@ -373,13 +540,106 @@ Style:
     # 3) SINGLE RETURN AT END
     # -------------------------------
     return (
-        fit_score,
-        fit_explanations,
-        talking_points,
+        base.fit_score,
+        base.fit_explanations,
+        base.talking_points,
         email,
         one_pager,
-        evidence,
-        offer_packages,
-        measurement_plan,
-        recommended_assets,
-    )
\ No newline at end of file
+        base.evidence,
+        base.offer_packages,
+        base.measurement_plan,
+        base.recommended_assets,
+    )
+
+
+VariantSource = Literal["llm", "template"]
+
+
+def _unique(pairs: Iterator[tuple[str, str]]) -> Iterator[tuple[str, str]]:
+    seen: set[tuple[str, str]] = set()
+    for pair in pairs:
+        if pair not in seen:
+            seen.add(pair)
+            yield pair
+
+
+def build_outreach_variants(
+    *,
+    engine: Engine,
+    athlete_id: str,
+    sponsor_id: str,
+    locale: str,
+    market: str,
+    tones: list[str],
+    channels: list[str],
+    max_variants: int,
+) -> tuple[PackBase, list[tuple[str, str, EmailOutreach, str, VariantSource]]]:
+    """Build one pack base and up to ``max_variants`` (tone, channel) copies.
+
+    Duplicate (tone, channel) pairs are dropped. LLM generations run concurrently
+    (bounded by ``llm_max_concurrency``) under a shared deadline; any variant that
+    fails or misses it gets the template copy for its tone and channel.
+    Each variant is ``(tone, channel, email, one_pager_markdown, source)``.
+    """
+    base = build_pack_base(
+        engine=engine,
+        athlete_id=athlete_id,
+        sponsor_id=sponsor_id,
+        locale=locale,
+        market=market,
+    )
+    # Lazily, so only the first ``max_variants`` distinct pairs are ever built.
+    pairs = ((tone, channel) for tone in tones for channel in channels)
+    combos = list(itertools.islice(_unique(pairs), max_variants))
+    templates = {
+        (tone, channel): _template_email(base=base, locale=locale, tone=tone, channel=channel)
+        for tone, channel in combos
+    }
+
+    if not _llm_enabled():
+        return base, [
+            (tone, channel, templates[(tone, channel)], base.template_one_pager, "template")
+            for tone, channel in combos
+        ]
+
+    deadline = time.monotonic() + settings.llm_variant_timeout_seconds
+    executor = ThreadPoolExecutor(
+        max_workers=max(1, min(settings.llm_max_concurrency, len(combos)))
+    )
+    try:
+        # Each task runs in a copy of the request context so per-request hooks
+        # (profiling timings) still see these calls.
+        futures = [
+            executor.submit(
+                contextvars.copy_context().run,
+                _llm_copy,
+                base=base,
+                locale=locale,
+                tone=tone,
+                channel=channel,
+                deadline=deadline,
+            )
+            for tone, channel in combos
+        ]
+
+        variants: list[tuple[str, str, EmailOutreach, str, VariantSource]] = []
+        for (tone, channel), future in zip(combos, futures):
+            try:
+                remaining = max(0.0, deadline - time.monotonic())
+                email, one_pager = future.result(timeout=remaining)
+                variants.append((tone, channel, email, one_pager, "llm"))
+            except (FutureTimeoutError, LlmError):
+                variants.append(
+                    (
+                        tone,
+                        channel,
+                        templates[(tone, channel)],
+                        base.template_one_pager,
+                        "template",
+                    )
+                )
+    finally:
+        # Do not wait for stragglers; they are bounded by the shared deadline.
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    return base, variants
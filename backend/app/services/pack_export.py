@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import csv
+import io
+import json
+import zipfile
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+from sqlalchemy.engine import Engine
+
+from backend.app.services.listing import list_page
+
+# Generator pipeline for bulk exports: sponsors are read in keyset batches and
+# each encoder yields bytes per pack, so memory does not grow with campaign size.
+
+
+def iter_sponsors(
+    engine: Engine,
+    *,
+    market: str | None = None,
+    sector: str | None = None,
+    batch_size: int = 200,
+) -> Iterator[dict[str, Any]]:
+    after: str | None = None
+    while True:
+        rows, after = list_page(
+            engine,
+            table="sponsors",
+            filters={"market": market, "sector": sector},
+            after=after,
+            limit=batch_size,
+        )
+        yield from rows
+        if after is None:
+            return
+
+
+def ndjson_stream(records: Iterable[dict[str, Any]]) -> Iterator[bytes]:
+    for record in records:
+        yield (json.dumps(record, ensure_ascii=False, default=str) + "\n").encode("utf-8")
+
+
+def csv_stream(records: Iterable[dict[str, Any]], fieldnames: list[str]) -> Iterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=fieldnames, extrasaction="ignore")
+
+    def drain() -> bytes:
+        data = buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate(0)
+        return data
+
+    writer.writeheader()
+    yield drain()
+    for record in records:
+        writer.writerow(record)
+        yield drain()
+
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only, non-seekable sink: zipfile then streams entries with data descriptors."""
+
+    def __init__(self) -> None:
+        self._chunks: list[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, b: Any) -> int:
+        self._chunks.append(bytes(b))
+        return len(b)
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def zip_stream(files: Iterable[tuple[str, str]]) -> Iterator[bytes]:
+    sink = _ChunkSink()
+    with zipfile.ZipFile(sink, mode="w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for name, content in files:
+            archive.writestr(name, content)
+            yield sink.drain()
+    # Central directory is written on close.
+    yield sink.drain()
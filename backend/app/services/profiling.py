@@ -0,0 +1,246 @@
+from __future__ import annotations
+
+import random
+import secrets
+import sys
+import threading
+import time
+import uuid
+from collections import Counter, deque
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from functools import lru_cache, wraps
+from typing import Any, TypeVar
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from backend.app.core.config import settings
+
+# Opt-in per-request profiling. When a request is not profiled, the only cost is a
+# header scan in the middleware and a ContextVar lookup at each hook below.
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+_current: ContextVar[RequestProfile | None] = ContextVar("request_profile", default=None)
+
+
+class RequestProfile:
+    def __init__(self, *, method: str, path: str, query: str, trigger: str) -> None:
+        self.id = uuid.uuid4().hex[:12]
+        self.method = method
+        self.path = path
+        self.query = query
+        self.trigger = trigger
+        self.started_at = datetime.now(timezone.utc)
+        self.status_code: int | None = None
+        self.duration_ms: float | None = None
+        self.interval_ms = settings.profile_interval_ms
+        self.stacks: Counter[str] = Counter()
+        self.timings: dict[str, float] = {
+            "db_ms": 0.0,
+            "db_queries": 0,
+            "llm_ms": 0.0,
+            "llm_calls": 0,
+        }
+        self._started = time.perf_counter()
+        self._lock = threading.Lock()
+
+    def add_timing(self, kind: str, seconds: float) -> None:
+        with self._lock:
+            self.timings[f"{kind}_ms"] += seconds * 1000
+            self.timings["db_queries" if kind == "db" else f"{kind}_calls"] += 1
+
+    def add_sample(self, stack: str) -> None:
+        with self._lock:
+            self.stacks[stack] += 1
+
+    def finish(self, status_code: int | None) -> None:
+        self.status_code = status_code
+        self.duration_ms = (time.perf_counter() - self._started) * 1000
+
+    def metadata(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "id": self.id,
+                "method": self.method,
+                "path": self.path,
+                "query": self.query,
+                "trigger": self.trigger,
+                "started_at": self.started_at.isoformat(),
+                "status_code": self.status_code,
+                "duration_ms": self.duration_ms,
+                "interval_ms": self.interval_ms,
+                "samples": sum(self.stacks.values()),
+                "timings": dict(self.timings),
+            }
+
+    def folded(self) -> str:
+        """Collapsed-stack text (``frame;frame;frame count``) for flamegraph.pl / speedscope."""
+        with self._lock:
+            return "".join(f"{stack} {count}\n" for stack, count in self.stacks.items())
+
+
+class ProfileStore:
+    """Bounded ring buffer of finished profiles (oldest evicted first)."""
+
+    def __init__(self, size: int) -> None:
+        self._profiles: deque[RequestProfile] = deque(maxlen=size)
+        self._lock = threading.Lock()
+
+    def add(self, profile: RequestProfile) -> None:
+        with self._lock:
+            self._profiles.append(profile)
+
+    def get(self, profile_id: str) -> RequestProfile | None:
+        with self._lock:
+            return next((p for p in self._profiles if p.id == profile_id), None)
+
+    def list(self) -> list[RequestProfile]:
+        with self._lock:
+            return list(reversed(self._profiles))
+
+
+@lru_cache(maxsize=1)
+def get_profile_store() -> ProfileStore:
+    return ProfileStore(settings.profile_buffer_size)
+
+
+def current_profile() -> RequestProfile | None:
+    return _current.get()
+
+
+@contextmanager
+def timed(kind: str) -> Iterator[None]:
+    profile = _current.get()
+    if profile is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        profile.add_timing(kind, time.perf_counter() - started)
+
+
+def install_query_timing(engine: Engine) -> None:
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before(conn: Any, *_: Any) -> None:
+        if _current.get() is not None:
+            conn.info.setdefault("profile_query_start", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after(conn: Any, *_: Any) -> None:
+        profile = _current.get()
+        starts = conn.info.get("profile_query_start")
+        if profile is not None and starts:
+            profile.add_timing("db", time.perf_counter() - starts.pop())
+
+
+def _fold(frame: Any) -> str:
+    names: list[str] = []
+    while frame is not None:
+        code = frame.f_code
+        names.append(f"{frame.f_globals.get('__name__', '?')}:{code.co_qualname}")
+        frame = frame.f_back
+    return ";".join(reversed(names))
+
+
+def _sample_loop(profile: RequestProfile, thread_id: int, stop: threading.Event) -> None:
+    interval = profile.interval_ms / 1000
+    while not stop.wait(interval):
+        frame = sys._current_frames().get(thread_id)
+        if frame is not None:
+            profile.add_sample(_fold(frame))
+
+
+def profiled(func: F) -> F:
+    """Sample the calling thread's stack while ``func`` runs, if this request is profiled.
+
+    For sync route handlers: FastAPI runs them in a worker thread that inherits the
+    request's context, so the sampler follows the thread doing the actual work.
+    """
+
+    @wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        profile = _current.get()
+        if profile is None:
+            return func(*args, **kwargs)
+
+        stop = threading.Event()
+        sampler = threading.Thread(
+            target=_sample_loop,
+            args=(profile, threading.get_ident(), stop),
+            name=f"profiler-{profile.id}",
+            daemon=True,
+        )
+        sampler.start()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            stop.set()
+            sampler.join()
+
+    return wrapper  # type: ignore[return-value]
+
+
+def _trigger(scope: dict[str, Any]) -> str | None:
+    if scope["path"].startswith("/admin"):
+        return None
+    # The header trigger is admin-only and disabled entirely without an admin token.
+    if settings.profile_header_enabled and settings.admin_token:
+        headers = dict(scope["headers"])
+        if headers.get(b"x-profile") in (b"1", b"true") and is_admin_token(
+            headers.get(b"x-admin-token", b"").decode("latin-1")
+        ):
+            return "header"
+    if settings.profile_sample_rate > 0 and random.random() < settings.profile_sample_rate:
+        return "sample"
+    return None
+
+
+def is_admin_token(token: str | None) -> bool:
+    # Fails closed: no configured token means nobody is an admin.
+    if not settings.admin_token or token is None:
+        return False
+    return secrets.compare_digest(token, settings.admin_token)
+
+
+class ProfilingMiddleware:
+    """Pure ASGI middleware: starts a RequestProfile for triggered requests only."""
+
+    def __init__(self, app: Any) -> None:
+        self.app = app
+
+    async def __call__(self, scope: dict[str, Any], receive: Any, send: Any) -> None:
+        trigger = _trigger(scope) if scope["type"] == "http" else None
+        if trigger is None:
+            await self.app(scope, receive, send)
+            return
+
+        profile = RequestProfile(
+            method=scope["method"],
+            path=scope["path"],
+            query=scope.get("query_string", b"").decode("latin-1"),
+            trigger=trigger,
+        )
+        status: dict[str, int] = {}
+
+        async def send_with_id(message: dict[str, Any]) -> None:
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+                message["headers"] = [
+                    *message.get("headers", []),
+                    (b"x-profile-id", profile.id.encode("ascii")),
+                ]
+            await send(message)
+
+        token = _current.set(profile)
+        try:
+            await self.app(scope, receive, send_with_id)
+        finally:
+            _current.reset(token)
+            profile.finish(status.get("code"))
+            get_profile_store().add(profile)
@@ -4,12 +4,9 @@ import random
 from dataclasses import dataclass
 from typing import Any
 
-from faker import Faker
 from sqlalchemy import text
 from sqlalchemy.engine import Engine
 
-fake = Faker()
-
 
 @dataclass(frozen=True)
 class SeedConfig:
@@ -32,8 +29,11 @@ def _fit_score(sector: str, athlete_position: str, market: str) -> float:
 
 
 def seed_fake_data(engine: Engine, config: SeedConfig) -> dict[str, int]:
+    from faker import Faker  # heavy import, only paid when seeding
+
     random.seed(config.seed)
     Faker.seed(config.seed)
+    fake = Faker()
 
     athletes: list[dict[str, Any]] = []
     sponsors: list[dict[str, Any]] = []
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import logging
+import time
+from dataclasses import dataclass, field
+
+from backend.app.core.config import settings
+from backend.app.db.session import check_connection, get_engine, warm_pool
+from backend.app.services.llm_client import LlmError, ollama_preload
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class StartupState:
+    import_seconds: float
+    startup_seconds: float | None = None
+    checks: dict[str, bool] = field(default_factory=dict)
+
+    @property
+    def ready(self) -> bool:
+        return self.startup_seconds is not None and all(self.checks.values())
+
+
+def warm_up(state: StartupState) -> StartupState:
+    started = time.perf_counter()
+
+    try:
+        warm_pool(get_engine(), settings.db_pool_warm_connections)
+        state.checks["db_pool"] = True
+    except Exception:  # noqa: BLE001 - stay up, /ready reports the failure
+        logger.exception("Database pool warm-up failed")
+        state.checks["db_pool"] = False
+
+    if settings.llm_warmup and settings.generation_mode == "llm":
+        try:
+            ollama_preload()
+            state.checks["llm"] = True
+        except LlmError:
+            # Not fatal: build_outreach_pack falls back to templates anyway.
+            logger.warning("LLM preload failed; first llm requests will be cold")
+
+    state.startup_seconds = time.perf_counter() - started
+    logger.info(
+        "Startup complete: import=%.3fs warm-up=%.3fs checks=%s",
+        state.import_seconds,
+        state.startup_seconds,
+        state.checks,
+    )
+    return state
+
+
+def refresh_db_check(state: StartupState) -> StartupState:
+    # Called by /ready: a DB that was down at boot (or went away later) is picked up
+    # without restarting the process.
+    try:
+        check_connection(get_engine())
+        state.checks["db_pool"] = True
+    except Exception:  # noqa: BLE001 - reported through /ready
+        logger.warning("Database readiness check failed", exc_info=True)
+        state.checks["db_pool"] = False
+    return state
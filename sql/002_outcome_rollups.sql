@@ -0,0 +1,76 @@
+-- Outcome analytics: daily rollups of interactions, maintained by trigger.
+-- Dashboards read these rows instead of scanning `interactions`.
+
+CREATE TABLE IF NOT EXISTS interaction_rollups (
+  bucket_day DATE NOT NULL, -- UTC day of interactions.created_at
+  sector TEXT NOT NULL,     -- from sponsors
+  market TEXT NOT NULL,     -- from sponsors
+  position TEXT NOT NULL,   -- from athletes
+  channel TEXT NOT NULL,
+  total BIGINT NOT NULL DEFAULT 0,
+  replied BIGINT NOT NULL DEFAULT 0,
+  interested BIGINT NOT NULL DEFAULT 0,
+  PRIMARY KEY (bucket_day, sector, market, position, channel)
+);
+
+CREATE OR REPLACE FUNCTION interaction_rollups_bump(r interactions, delta INT)
+RETURNS void AS $$
+BEGIN
+  INSERT INTO interaction_rollups AS ir
+    (bucket_day, sector, market, position, channel, total, replied, interested)
+  SELECT
+    (r.created_at AT TIME ZONE 'UTC')::date,
+    s.sector,
+    s.market,
+    a.position,
+    r.channel,
+    delta,
+    CASE WHEN r.outcome = 'replied' THEN delta ELSE 0 END,
+    CASE WHEN r.outcome = 'interested' THEN delta ELSE 0 END
+  FROM sponsors s, athletes a
+  WHERE s.id = r.sponsor_id AND a.id = r.athlete_id
+  ON CONFLICT (bucket_day, sector, market, position, channel) DO UPDATE SET
+    total = ir.total + EXCLUDED.total,
+    replied = ir.replied + EXCLUDED.replied,
+    interested = ir.interested + EXCLUDED.interested;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION interaction_rollups_apply()
+RETURNS trigger AS $$
+BEGIN
+  IF TG_OP IN ('UPDATE', 'DELETE') THEN
+    PERFORM interaction_rollups_bump(OLD, -1);
+  END IF;
+  IF TG_OP IN ('INSERT', 'UPDATE') THEN
+    PERFORM interaction_rollups_bump(NEW, 1);
+  END IF;
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_interaction_rollups ON interactions;
+CREATE TRIGGER trg_interaction_rollups
+  AFTER INSERT OR UPDATE OR DELETE ON interactions
+  FOR EACH ROW EXECUTE FUNCTION interaction_rollups_apply();
+
+-- One-time backfill of history that predates the trigger.
+BEGIN;
+LOCK TABLE interactions IN SHARE MODE;
+TRUNCATE interaction_rollups;
+INSERT INTO interaction_rollups
+  (bucket_day, sector, market, position, channel, total, replied, interested)
+SELECT
+  (i.created_at AT TIME ZONE 'UTC')::date,
+  s.sector,
+  s.market,
+  a.position,
+  i.channel,
+  COUNT(*),
+  COUNT(*) FILTER (WHERE i.outcome = 'replied'),
+  COUNT(*) FILTER (WHERE i.outcome = 'interested')
+FROM interactions i
+JOIN sponsors s ON s.id = i.sponsor_id
+JOIN athletes a ON a.id = i.athlete_id
+GROUP BY 1, 2, 3, 4, 5;
+COMMIT;
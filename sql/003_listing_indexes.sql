@@ -0,0 +1,33 @@
+-- Keyset pagination for GET /athletes, /sponsors, /documents:
+--   WHERE <filters> AND id > :after ORDER BY id LIMIT n
+-- An index (equality filters..., id) turns that into one index range scan in id order.
+-- Filter combination -> index:
+--   athletes   (none)                  -> primary key
+--   athletes   position                -> idx_athletes_position_id
+--   sponsors   (none)                  -> primary key
+--   sponsors   market                  -> idx_sponsors_market_id
+--   sponsors   sector                  -> idx_sponsors_sector_id
+--   sponsors   market + sector         -> idx_sponsors_market_sector_id
+--   documents  (none)                  -> primary key
+--   documents  locale                  -> idx_documents_locale_id
+--   documents  owner_id                -> idx_documents_owner_id_id
+--   documents  owner_type + owner_id   -> idx_documents_owner_type_owner_id
+-- Not a single range scan (by design):
+--   documents owner_type alone: only 3 values, so walking the primary key and filtering
+--   reads ~3 rows per returned row; locale combined with owner filters uses the owner
+--   index and filters locale.
+-- CONCURRENTLY: safe to run against a live database (must run outside a transaction).
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_athletes_position_id ON athletes(position, id);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_sponsors_market_id ON sponsors(market, id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_sponsors_sector_id ON sponsors(sector, id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_sponsors_market_sector_id ON sponsors(market, sector, id);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_documents_locale_id ON documents(locale, id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_documents_owner_id_id ON documents(owner_id, id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_documents_owner_type_owner_id ON documents(owner_type, owner_id, id);
+
+-- Superseded by the composite indexes above (same leading columns).
+DROP INDEX CONCURRENTLY IF EXISTS idx_documents_locale;
+DROP INDEX CONCURRENTLY IF EXISTS idx_documents_owner;
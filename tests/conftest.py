@@ -0,0 +1,4 @@
+import os
+
+# Settings() requires a database URL at import time; unit tests never connect.
+os.environ.setdefault("COPILOT_DATABASE_URL", "sqlite://")
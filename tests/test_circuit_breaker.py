@@ -0,0 +1,106 @@
+import pytest
+
+from backend.app.services import circuit_breaker
+from backend.app.services.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    fake = FakeClock()
+    monkeypatch.setattr(circuit_breaker.time, "monotonic", fake)
+    return fake
+
+
+def make_breaker(**overrides: float) -> CircuitBreaker:
+    params = {
+        "window": 4,
+        "min_calls": 2,
+        "failure_rate": 0.5,
+        "open_seconds": 10,
+        "half_open_probes": 2,
+    }
+    params.update(overrides)
+    return CircuitBreaker(**params)  # type: ignore[arg-type]
+
+
+def state(breaker: CircuitBreaker) -> str:
+    return breaker.snapshot()["state"]
+
+
+def test_stays_closed_below_min_calls(clock: FakeClock) -> None:
+    breaker = make_breaker(min_calls=3)
+    breaker.record_failure()
+    breaker.record_failure()
+    assert state(breaker) == CLOSED
+    assert breaker.allow()
+
+
+def test_stays_closed_below_failure_rate(clock: FakeClock) -> None:
+    breaker = make_breaker(failure_rate=0.75)
+    for ok in (True, False, True, False):
+        breaker.record_success() if ok else breaker.record_failure()
+    assert state(breaker) == CLOSED
+
+
+def test_opens_at_failure_rate_and_rejects(clock: FakeClock) -> None:
+    breaker = make_breaker()
+    breaker.record_success()
+    breaker.record_failure()
+    assert state(breaker) == OPEN
+    assert not breaker.allow()
+    assert breaker.snapshot()["retry_in_seconds"] == pytest.approx(10)
+
+
+def test_full_cycle_closed_open_half_open_closed(clock: FakeClock) -> None:
+    breaker = make_breaker()
+    breaker.record_failure()
+    breaker.record_failure()
+    assert state(breaker) == OPEN
+
+    clock.now += 10
+    assert breaker.allow()
+    assert state(breaker) == HALF_OPEN
+    assert breaker.allow()
+    assert not breaker.allow()  # only half_open_probes calls get through
+
+    breaker.record_success()
+    assert state(breaker) == HALF_OPEN
+    breaker.record_success()
+    assert state(breaker) == CLOSED
+    assert breaker.snapshot()["window_calls"] == 0
+    assert breaker.allow()
+
+
+def test_failed_probe_reopens(clock: FakeClock) -> None:
+    breaker = make_breaker()
+    breaker.record_failure()
+    breaker.record_failure()
+    clock.now += 10
+    assert breaker.allow()
+
+    breaker.record_failure()
+    assert state(breaker) == OPEN
+    assert not breaker.allow()
+    clock.now += 10
+    assert breaker.allow()
+
+
+def test_ignored_probe_frees_its_slot(clock: FakeClock) -> None:
+    breaker = make_breaker(half_open_probes=1)
+    breaker.record_failure()
+    breaker.record_failure()
+    clock.now += 10
+    assert breaker.allow()
+    assert not breaker.allow()
+
+    breaker.record_ignored()
+    assert state(breaker) == HALF_OPEN
+    assert breaker.allow()
@@ -0,0 +1,100 @@
+import json
+
+import pytest
+
+from backend.app.services.json_stream import IncrementalJsonValidator, JsonStreamError
+
+REQUIRED = ("subject", "body", "one_pager_markdown")
+
+VALID = json.dumps(
+    {
+        "subject": 'Pilot "idea" — été\n',
+        "body": "Hi \\u00e9",
+        "extra": [1, -2.5e3, True, False, None, {"nested": []}],
+        "one_pager_markdown": "# Title",
+    }
+)
+
+
+def feed_all(
+    text: str, chunk_size: int, required: tuple[str, ...] = REQUIRED
+) -> IncrementalJsonValidator:
+    validator = IncrementalJsonValidator(required)
+    for i in range(0, len(text), chunk_size):
+        validator.feed(text[i : i + chunk_size])
+    return validator
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, len(VALID)])
+def test_valid_document_completes_in_any_chunking(chunk_size: int) -> None:
+    validator = feed_all(VALID, chunk_size)
+    assert validator.complete
+    assert set(REQUIRED) <= validator.seen_keys
+
+
+def test_leading_whitespace_and_valid_prefixes_are_accepted() -> None:
+    for end in range(1, len(VALID)):
+        validator = IncrementalJsonValidator(REQUIRED)
+        validator.feed("  \n" + VALID[:end])
+        assert not validator.complete
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "[",
+        '"just a string"',
+        '{"a": tru}',
+        '{"a": trux',
+        '{"a": 1,}',
+        '{"a" 1}',
+        '{"a": 1 "b": 2}',
+        '{"a": [1}',
+        '{"a": "\\q"}',
+        '{"a": "\\u12G4"}',
+        '{"a": "line\nbreak"}',
+        "{1: 2}",
+    ],
+)
+def test_invalid_prefixes_fail_immediately(text: str) -> None:
+    with pytest.raises(JsonStreamError):
+        IncrementalJsonValidator().feed(text)
+
+
+@pytest.mark.parametrize("value", ["42", "null", "[]", '{"x": "y"}', "true"])
+def test_required_keys_must_be_strings(value: str) -> None:
+    with pytest.raises(JsonStreamError, match="must be a string"):
+        IncrementalJsonValidator(REQUIRED).feed('{"subject": ' + value)
+
+
+def test_non_required_keys_may_have_any_type() -> None:
+    validator = IncrementalJsonValidator(("subject",))
+    validator.feed('{"count": 3, "subject": "s"}')
+    assert validator.complete
+
+
+def test_nested_required_key_names_do_not_count() -> None:
+    with pytest.raises(JsonStreamError, match="Missing keys: subject"):
+        IncrementalJsonValidator(("subject",)).feed('{"meta": {"subject": "s"}}')
+
+
+def test_missing_required_keys_fail_on_close() -> None:
+    validator = IncrementalJsonValidator(REQUIRED)
+    validator.feed('{"subject": "s", "body": "b"')
+    with pytest.raises(JsonStreamError, match="one_pager_markdown"):
+        validator.feed("}")
+
+
+def test_trailing_whitespace_is_fine_but_trailing_data_is_not() -> None:
+    validator = feed_all(VALID, 5)
+    validator.feed(" \n\t")
+    assert validator.complete
+    with pytest.raises(JsonStreamError, match="Trailing data"):
+        validator.feed("x")
+
+
+def test_number_is_checked_when_it_ends() -> None:
+    validator = IncrementalJsonValidator()
+    validator.feed('{"a": 1.2.3')  # still a plausible prefix character-wise
+    with pytest.raises(JsonStreamError, match="Invalid literal"):
+        validator.feed("}")
@@ -0,0 +1,133 @@
+import json
+import threading
+import time
+from collections.abc import Iterator
+from typing import Any, Self
+
+import pytest
+
+from backend.app.services import llm_client
+from backend.app.services.circuit_breaker import CircuitBreaker
+from backend.app.services.llm_client import LlmDeadlineError, LlmError, LlmTimeoutError
+from backend.app.services.llm_pool import LlmBackend, LlmBackendPool
+
+ANSWER = '{"subject": "s", "body": "b", "one_pager_markdown": "m"}'
+REQUIRED = ("subject", "body", "one_pager_markdown")
+PAYLOAD = {"model": "test", "prompt": "p", "stream": True}
+
+
+class FakeStream:
+    """Ollama-style NDJSON stream that takes ``seconds_per_token`` per token."""
+
+    def __init__(self, seconds_per_token: float) -> None:
+        self.seconds_per_token = seconds_per_token
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        pass
+
+    def raise_for_status(self) -> None:
+        pass
+
+    def iter_lines(self) -> Iterator[bytes]:
+        for char in ANSWER:
+            time.sleep(self.seconds_per_token)
+            yield json.dumps({"response": char, "done": False}).encode()
+        yield json.dumps({"response": "", "done": True}).encode()
+
+
+@pytest.fixture
+def breaker(monkeypatch: pytest.MonkeyPatch) -> CircuitBreaker:
+    fake = CircuitBreaker(
+        window=10, min_calls=1, failure_rate=0.5, open_seconds=30, half_open_probes=1
+    )
+    monkeypatch.setattr(llm_client, "get_llm_breaker", lambda: fake)
+    return fake
+
+
+@pytest.fixture
+def pool(monkeypatch: pytest.MonkeyPatch) -> LlmBackendPool:
+    fake = LlmBackendPool(
+        [LlmBackend(url="http://llm:11434", max_concurrency=1)],
+        eject_after_failures=1,
+        health_interval_seconds=60,
+    )
+    monkeypatch.setattr(llm_client, "get_llm_pool", lambda: fake)
+    return fake
+
+
+def serve(monkeypatch: pytest.MonkeyPatch, seconds_per_token: float) -> None:
+    def fake_post(url: str, **kwargs: Any) -> FakeStream:
+        return FakeStream(seconds_per_token)
+
+    monkeypatch.setattr(llm_client.requests, "post", fake_post)
+
+
+def test_capacity_timeout_is_not_a_backend_failure(
+    monkeypatch: pytest.MonkeyPatch, breaker: CircuitBreaker, pool: LlmBackendPool
+) -> None:
+    serve(monkeypatch, 0)
+    with pool.acquire(wait_seconds=0), pytest.raises(LlmError, match="capacity"):
+        llm_client._post_generate(PAYLOAD, 0.05, REQUIRED)
+    assert breaker.snapshot()["window_calls"] == 0
+    assert pool.backends[0].consecutive_failures == 0
+
+
+def test_queue_time_does_not_eat_the_read_timeout(
+    monkeypatch: pytest.MonkeyPatch, breaker: CircuitBreaker, pool: LlmBackendPool
+) -> None:
+    # Each generation takes ~0.2s against a 0.3s read timeout; the second call
+    # waits ~0.2s for the only slot and must still succeed.
+    serve(monkeypatch, 0.2 / len(ANSWER))
+    results: list[dict[str, Any]] = []
+
+    def call() -> None:
+        results.append(llm_client._post_generate(PAYLOAD, 0.3, REQUIRED))
+
+    first = threading.Thread(target=call)
+    first.start()
+    time.sleep(0.02)
+    call()
+    first.join(timeout=5)
+
+    assert [r["response"] for r in results] == [ANSWER, ANSWER]
+    assert breaker.snapshot()["window_failure_rate"] == 0.0
+    assert pool.backends[0].healthy
+
+
+def test_slow_backend_counts_as_failure(
+    monkeypatch: pytest.MonkeyPatch, breaker: CircuitBreaker, pool: LlmBackendPool
+) -> None:
+    serve(monkeypatch, 0.01)
+    with pytest.raises(LlmTimeoutError):
+        llm_client._post_generate(PAYLOAD, 0.05, REQUIRED)
+    assert breaker.snapshot()["state"] == "open"
+    assert not pool.backends[0].healthy
+
+
+def test_caller_deadline_is_not_a_backend_failure(
+    monkeypatch: pytest.MonkeyPatch, breaker: CircuitBreaker, pool: LlmBackendPool
+) -> None:
+    serve(monkeypatch, 0.01)
+    with pytest.raises(LlmDeadlineError):
+        llm_client._post_generate(
+            PAYLOAD, 10, REQUIRED, caller_deadline=time.monotonic() + 0.05
+        )
+    assert breaker.snapshot()["window_calls"] == 0
+    assert pool.backends[0].consecutive_failures == 0
+
+
+def test_expired_caller_deadline_skips_the_call(
+    monkeypatch: pytest.MonkeyPatch, breaker: CircuitBreaker, pool: LlmBackendPool
+) -> None:
+    def fail_post(url: str, **kwargs: Any) -> None:
+        raise AssertionError("no request expected")
+
+    monkeypatch.setattr(llm_client.requests, "post", fail_post)
+    with pytest.raises(LlmDeadlineError):
+        llm_client._post_generate(
+            PAYLOAD, 10, REQUIRED, caller_deadline=time.monotonic() - 1
+        )
+    assert breaker.snapshot()["window_calls"] == 0
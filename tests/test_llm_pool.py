@@ -0,0 +1,133 @@
+import threading
+import time
+
+import pytest
+import requests
+
+from backend.app.services import llm_pool
+from backend.app.services.llm_pool import (
+    LlmBackend,
+    LlmBackendPool,
+    NoLlmBackendError,
+    parse_backends,
+)
+
+
+def make_pool(*caps: int, eject_after_failures: int = 2) -> LlmBackendPool:
+    backends = [
+        LlmBackend(url=f"http://llm{i}:11434", max_concurrency=cap)
+        for i, cap in enumerate(caps)
+    ]
+    return LlmBackendPool(
+        backends,
+        eject_after_failures=eject_after_failures,
+        health_interval_seconds=60,
+    )
+
+
+def test_parse_backends_reads_caps_and_defaults() -> None:
+    backends = parse_backends(" http://a:11434/|8, ,http://b:11434 ", default_concurrency=3)
+    assert [(b.url, b.max_concurrency) for b in backends] == [
+        ("http://a:11434", 8),
+        ("http://b:11434", 3),
+    ]
+
+
+def test_pool_requires_a_backend() -> None:
+    with pytest.raises(ValueError):
+        LlmBackendPool([], eject_after_failures=1, health_interval_seconds=1)
+
+
+def test_acquire_prefers_lowest_load_ratio() -> None:
+    pool = make_pool(4, 1)
+    big, small = pool.backends
+    with pool.acquire(wait_seconds=0) as first:
+        # Both start idle; whichever wins the tie, the other is now less loaded.
+        with pool.acquire(wait_seconds=0) as second:
+            assert {first.url, second.url} == {big.url, small.url}
+            # small is full, big is at 1/4 and still has room.
+            with pool.acquire(wait_seconds=0) as third:
+                assert third is big
+    assert big.outstanding == 0 and small.outstanding == 0
+
+
+def test_acquire_rotates_ties() -> None:
+    pool = make_pool(2, 2, 2)
+    picked = []
+    for _ in range(6):
+        with pool.acquire(wait_seconds=0) as backend:
+            picked.append(backend.url)
+    assert set(picked) == {b.url for b in pool.backends}
+
+
+def test_acquire_times_out_when_at_capacity() -> None:
+    pool = make_pool(1)
+    with pool.acquire(wait_seconds=0):
+        started = time.monotonic()
+        with pytest.raises(NoLlmBackendError, match="capacity"):
+            with pool.acquire(wait_seconds=0.05):
+                pass
+        assert time.monotonic() - started >= 0.05
+
+
+def test_acquire_waits_for_released_capacity() -> None:
+    pool = make_pool(1)
+    holding = threading.Event()
+    release = threading.Event()
+
+    def hold() -> None:
+        with pool.acquire(wait_seconds=0):
+            holding.set()
+            release.wait(timeout=5)
+
+    holder = threading.Thread(target=hold)
+    holder.start()
+    assert holding.wait(timeout=5)
+    threading.Timer(0.05, release.set).start()
+    with pool.acquire(wait_seconds=5) as backend:
+        assert backend.outstanding == 1
+    holder.join(timeout=5)
+
+
+def test_consecutive_failures_eject_and_success_resets() -> None:
+    pool = make_pool(1, eject_after_failures=2)
+    (backend,) = pool.backends
+    pool.mark_failure(backend)
+    pool.mark_success(backend)
+    pool.mark_failure(backend)
+    assert backend.healthy
+    pool.mark_failure(backend)
+    assert not backend.healthy
+    with pytest.raises(NoLlmBackendError, match="healthy"):
+        with pool.acquire(wait_seconds=1):
+            pass
+
+
+def test_ejected_backend_is_skipped() -> None:
+    pool = make_pool(1, 1, eject_after_failures=1)
+    bad, good = pool.backends
+    pool.mark_failure(bad)
+    for _ in range(3):
+        with pool.acquire(wait_seconds=0) as backend:
+            assert backend is good
+
+
+def test_health_check_readmits_and_ejects(monkeypatch: pytest.MonkeyPatch) -> None:
+    pool = make_pool(1, 1, eject_after_failures=1)
+    down, up = pool.backends
+    pool.mark_failure(down)
+    assert not down.healthy
+
+    class Ok:
+        def raise_for_status(self) -> None:
+            pass
+
+    def fake_get(url: str, timeout: float) -> Ok:
+        if url.startswith(up.url):
+            raise requests.ConnectionError("refused")
+        return Ok()
+
+    monkeypatch.setattr(llm_pool.requests, "get", fake_get)
+    pool.check_health()
+    assert down.healthy and down.consecutive_failures == 0
+    assert not up.healthy
@@ -0,0 +1,170 @@
+import time
+from typing import Any
+
+import pytest
+from pydantic import ValidationError
+
+from backend.app.core.config import settings
+from backend.app.schemas import EmailOutreach, OutreachVariantsRequest
+from backend.app.services import outreach_pack
+from backend.app.services.llm_client import LlmError
+from backend.app.services.outreach_pack import (
+    PackBase,
+    _template_email,
+    build_outreach_variants,
+)
+
+EN_BODY = "Hi {FirstName},\n\nPilot pitch.\n\nBest,\nDaniel\n"
+FR_BODY = "Bonjour {Prénom},\n\nPitch pilote.\n\nBien cordialement,\nDaniel\n"
+
+
+def make_base(body: str = EN_BODY) -> PackBase:
+    return PackBase(
+        athlete={"full_name": "Alex Martin"},
+        sponsor={"name": "Acme"},
+        fit_score=0.7,
+        fit_explanations=[],
+        talking_points=[],
+        evidence=[],
+        offer_packages=[],
+        measurement_plan={},
+        recommended_assets=[],
+        template_email=EmailOutreach(subject="Partnership idea", body=body),
+        template_one_pager="# One pager\n",
+    )
+
+
+@pytest.fixture
+def base(monkeypatch: pytest.MonkeyPatch) -> PackBase:
+    pack_base = make_base()
+    monkeypatch.setattr(outreach_pack, "build_pack_base", lambda **kwargs: pack_base)
+    return pack_base
+
+
+@pytest.fixture
+def llm_mode(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "generation_mode", "llm")
+    monkeypatch.setattr(settings, "llm_provider", "ollama")
+    monkeypatch.setattr(settings, "llm_max_concurrency", 4)
+    monkeypatch.setattr(settings, "llm_variant_timeout_seconds", 0.3)
+
+
+def variants(tones: list[str], channels: list[str], max_variants: int = 12) -> list:
+    _, result = build_outreach_variants(
+        engine=None,  # type: ignore[arg-type]
+        athlete_id="ath_001",
+        sponsor_id="sp_001",
+        locale="en-GB",
+        market="UK",
+        tones=tones,
+        channels=channels,
+        max_variants=max_variants,
+    )
+    return result
+
+
+def test_template_email_keeps_base_copy_for_default_tone() -> None:
+    base = make_base()
+    email = _template_email(
+        base=base, locale="en-GB", tone="premium_warm", channel="email"
+    )
+    assert email == base.template_email
+
+
+def test_template_email_swaps_greeting_and_signoff_per_tone() -> None:
+    email = _template_email(
+        base=make_base(FR_BODY), locale="fr-FR", tone="formal", channel="email"
+    )
+    assert email.body.startswith("Madame, Monsieur,")
+    assert "Pitch pilote." in email.body
+    assert "salutations distinguées,\nDaniel\n" in email.body
+
+
+def test_template_email_unknown_tone_falls_back_to_default() -> None:
+    base = make_base()
+    email = _template_email(base=base, locale="en-GB", tone="quirky", channel="email")
+    assert email == base.template_email
+
+
+def test_template_email_short_channel_and_call_script() -> None:
+    base = make_base()
+    short = _template_email(
+        base=base, locale="en-GB", tone="direct", channel="linkedin"
+    )
+    call = _template_email(base=base, locale="en-GB", tone="direct", channel="call")
+    assert short.body.startswith("Hi {FirstName},") and short.body.endswith(
+        "Thanks,\nDaniel\n"
+    )
+    assert len(short.body) < len(base.template_email.body) + 200
+    assert call.subject == "Call script: Acme × Alex Martin"
+    assert call.body.startswith("1) Intro")
+
+
+def test_template_variants_are_distinct_deduplicated_and_capped(base: PackBase) -> None:
+    result = variants(["direct", "formal", "direct"], ["email", "sms"], max_variants=3)
+    assert [(tone, channel) for tone, channel, *_ in result] == [
+        ("direct", "email"),
+        ("direct", "sms"),
+        ("formal", "email"),
+    ]
+    assert {source for *_, source in result} == {"template"}
+    assert len({email.body for _, _, email, _, _ in result}) == 3
+
+
+def test_pairs_are_generated_lazily(base: PackBase) -> None:
+    # 10^10 pairs: only the first two may ever be built.
+    many = [str(i) for i in range(100_000)]
+    result = variants(many, many, max_variants=2)
+    assert [(tone, channel) for tone, channel, *_ in result] == [("0", "0"), ("0", "1")]
+
+
+def test_request_rejects_oversized_lists() -> None:
+    with pytest.raises(ValidationError):
+        OutreachVariantsRequest(athlete_id="a", sponsor_id="s", tones=["direct"] * 13)
+    with pytest.raises(ValidationError):
+        OutreachVariantsRequest(athlete_id="a", sponsor_id="s", channels=["email"] * 13)
+
+
+def test_llm_failures_fall_back_to_templates(
+    monkeypatch: pytest.MonkeyPatch, base: PackBase, llm_mode: None
+) -> None:
+    calls: list[dict[str, Any]] = []
+
+    def fake_generate(**kwargs: Any) -> dict[str, str]:
+        calls.append(kwargs)
+        if "Tone: formal" in kwargs["prompt"]:
+            raise LlmError("bad output")
+        return {"subject": "LLM", "body": "llm body", "one_pager_markdown": "llm pager"}
+
+    monkeypatch.setattr(outreach_pack, "ollama_generate_json", fake_generate)
+    started = time.monotonic()
+    result = variants(["direct", "formal"], ["email"])
+
+    by_tone = {tone: (email, pager, source) for tone, _, email, pager, source in result}
+    assert by_tone["direct"] == (
+        EmailOutreach(subject="LLM", body="llm body"),
+        "llm pager",
+        "llm",
+    )
+    assert by_tone["formal"][2] == "template"
+    assert by_tone["formal"][0].body.startswith("Dear {FirstName},")
+    # The shared deadline is passed as the caller deadline, not as the read timeout.
+    for kwargs in calls:
+        assert "timeout" not in kwargs
+        assert started < kwargs["deadline"] <= time.monotonic() + 0.3
+
+
+def test_variants_missing_the_deadline_get_templates(
+    monkeypatch: pytest.MonkeyPatch, base: PackBase, llm_mode: None
+) -> None:
+    def slow_generate(**kwargs: Any) -> dict[str, str]:
+        if "Tone: formal" in kwargs["prompt"]:
+            time.sleep(1)
+        return {"subject": "LLM", "body": "llm body", "one_pager_markdown": "llm pager"}
+
+    monkeypatch.setattr(outreach_pack, "ollama_generate_json", slow_generate)
+    started = time.monotonic()
+    result = variants(["direct", "formal"], ["email"])
+
+    assert time.monotonic() - started < 0.8
+    assert [source for *_, source in result] == ["llm", "template"]